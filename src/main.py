@@ -4,12 +4,22 @@ from tkinter.scrolledtext import ScrolledText
 from tkinter import ttk
 import os
 import json
+import re
+from array import array
+from bisect import bisect_left, bisect_right
+import struct
 from PIL import Image, ImageTk
-import subprocess
-import tempfile
 import traceback
+import threading
+import hashlib
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, islice
+from operator import attrgetter, itemgetter
 from io import BytesIO
-from urllib.request import urlopen
+import http.client
+import urllib.request
+from urllib.parse import urljoin, urlsplit
 
 # =========================
 # CONSTANTS FOR THIS ROM
@@ -32,6 +42,17 @@ SECOND_CARD_STATS_BASE = 0x1821E04
 SECOND_CARD_STATS_SIZE = 0x16
 SECOND_STATS_COUNT = 2648  # you specified this
 
+# Precompiled little-endian layouts for ROM writes
+U16_STRUCT = struct.Struct("<H")
+U32_STRUCT = struct.Struct("<I")
+CARD_STATS_STRUCT = struct.Struct("<11H")  # one stats entry (0x16 bytes)
+PACK_HEADER_STRUCT = struct.Struct("<6H")  # cost .. padding
+# CardEntry fields in primary stats row order
+_CARD_STATS_PRIMARY_FIELDS = attrgetter(
+    "konami_id", "artwork_id", "edited_flag", "atk", "deff", "level",
+    "race", "attribute", "type_", "st_race", "padding",
+)
+
 # Card ID table (Konami ID -> card name index or 0xFFFF)
 CARD_ID_TABLE_BASE = 0x15B7CCC
 KONAMI_ID_BASE = 4007  # Konami ID offset
@@ -58,8 +79,13 @@ CARD_PAL_BASE = 0x4C76C0       # start of card palettes
 CARD_PAL_SIZE = 0x80           # bytes per card palette (64 colors * 2 bytes)
 NUM_CARD_GFX = 2331            # total graphics slots
 
-# Path to gbagfx executable (adjust to where you keep it)
-GBAGFX_PATH = "deps/gbagfx"
+# Lane masks for the whole-image 6bpp -> 8bpp unpack: one 6-bit field per
+# byte of each little-endian 32-bit word (see _decode_6bpp_to_8bpp)
+_CARD_PIXEL_WORDS = CARD_GFX_SIZE // 3
+_UNPACK_6BPP_MASKS = tuple(
+    int.from_bytes(lane * _CARD_PIXEL_WORDS, "little")
+    for lane in (b"\x3f\0\0\0", b"\0\x3f\0\0", b"\0\0\x3f\0", b"\0\0\0\x3f")
+)
 
 # =========================
 # CARD ICON CONSTANTS
@@ -82,6 +108,10 @@ LARGE_ICON_HEIGHT = 48  # 32 * 48 = 1536 = 0x600
 SMALL_ICON_WIDTH  = 24
 SMALL_ICON_HEIGHT = 24  # 24 * 24 = 576 = 0x240
 
+# Maps indices of the restricted quantization palette back to the ROM icon
+# palette: 0 -> 0, 1..128 -> 16..143, anything else -> 0.
+ICON_QUANT_REMAP = bytes([0] + list(range(16, 144)) + [0] * 127)
+
 IMAGES_DIR = os.path.join(os.path.dirname(__file__), "../images")
 
 # Password & price tables (indexed by card name index)
@@ -104,7 +134,239 @@ PACK_TABLE_BASE   = 0x1E5E2E8  # pack structs
 PACK_ENTRY_SIZE   = 0x10       # 16 bytes per pack
 NUM_PACKS         = 45         # total packs
 
+# =========================
+# UI CACHES
+# =========================
+FILTER_CACHE_SIZE = 64         # remembered card-dropdown filter patterns
+IMAGE_CACHE_SIZE  = 64         # decoded card art / icon previews kept around
+DECK_FILTER_LIMIT = 200        # max matches pushed into a deck-editor dropdown
+
+# =========================
+# DOWNLOADS
+# =========================
+HTTP_TIMEOUT      = 30         # seconds per connect / read
+HTTP_MAX_REDIRECTS = 5
+HTTP_USER_AGENT   = "Cyber-Twin-Dragon"
+
+# One YDK line that matters: a section marker (#main / #extra / #side) or a
+# card password, either optionally followed by a "--" comment. Everything
+# else (blank lines, full-line comments, "!" lines, other "#" lines) simply
+# doesn't match.
+YDK_LINE_RE = re.compile(
+    rb"^[ \t]*(?:#(main|extra|side)|(\d+))[ \t]*(?:--.*)?\r?$",
+    re.MULTILINE | re.IGNORECASE
+)
+
+def _wheel_steps(event):
+    """
+    Scroll steps for a mouse wheel event: negative = up. Windows/macOS
+    report <MouseWheel> with a delta (120 per notch on Windows, small
+    values on macOS); X11 sends <Button-4>/<Button-5> instead.
+    """
+    if event.num == 4:
+        return -1
+    if event.num == 5:
+        return 1
+    if not event.delta:
+        return 0
+    return -int(event.delta / 120) or (-1 if event.delta > 0 else 1)
+
+# GBA 5-bit colour channel -> 8-bit, same rounding as gbagfx
+_GBA_CHANNEL_TO_8BIT = [c * 255 // 31 for c in range(32)]
+
+def _gba_palette_to_rgb(pal_raw):
+    """
+    GBA BGR555 palette bytes -> flat RGB888 bytes for Image.putpalette().
+    """
+    up = _GBA_CHANNEL_TO_8BIT
+    colors = struct.unpack(f"<{len(pal_raw) // 2}H", pal_raw)
+    return bytes([
+        up[(c >> shift) & 0x1F]
+        for c in colors
+        for shift in (0, 5, 10)
+    ])
+
+def _detile_8bpp(data, width, height):
+    """
+    Rearrange 8bpp GBA tile data (8x8 tiles, left to right, top to bottom)
+    into plain row-major pixels, as gbagfx does when writing a PNG.
+
+    Each 8-pixel tile row is one 8-byte unit, so the shuffle is one strided
+    array copy per (row-in-tile, tile column) pair.
+    """
+    if len(data) != width * height:
+        raise ValueError(f"expected {width * height:#x} bytes for {width}x{height}, got {len(data):#x}")
+    tiles_w = width // 8
+    stride = tiles_w * 8  # 8-byte units per row of tiles
+    src = array("Q", data)
+    dst = array("Q", bytes(len(data)))
+    for r in range(8):
+        for tx in range(tiles_w):
+            dst[r * tiles_w + tx::stride] = src[tx * 8 + r::stride]
+    return dst.tobytes()
+
+def _tile_8bpp(pixels, width, height):
+    """
+    Inverse of _detile_8bpp: row-major 8bpp pixels -> GBA 8x8 tile data,
+    byte-for-byte what gbagfx writes for an indexed PNG.
+    """
+    if len(pixels) != width * height:
+        raise ValueError(f"expected {width * height:#x} bytes for {width}x{height}, got {len(pixels):#x}")
+    tiles_w = width // 8
+    stride = tiles_w * 8  # 8-byte units per row of tiles
+    src = array("Q", pixels)
+    dst = array("Q", bytes(len(pixels)))
+    for r in range(8):
+        for tx in range(tiles_w):
+            dst[tx * 8 + r::stride] = src[r * tiles_w + tx::stride]
+    return dst.tobytes()
+
+def _pack_8bpp_to_6bpp(data_8bpp):
+    """
+    Inverse of RomEditorApp._decode_6bpp_to_8bpp: every 4 pixel bytes
+    (values 0..63) become one little-endian 24-bit group. Each field is
+    masked in its byte lane and shifted down by 2*k bits as one big
+    integer, then the top byte of every 32-bit word is dropped.
+    """
+    v = int.from_bytes(data_8bpp, "little")
+    m0, m1, m2, m3 = _UNPACK_6BPP_MASKS
+    v = (v & m0) | ((v >> 2) & (m1 >> 2)) | ((v >> 4) & (m2 >> 4)) | ((v >> 6) & (m3 >> 6))
+    words = v.to_bytes(len(data_8bpp), "little")
+
+    out = bytearray(len(data_8bpp) // 4 * 3)
+    out[0::3] = words[0::4]
+    out[1::3] = words[1::4]
+    out[2::3] = words[2::4]
+    return bytes(out)
+
+def _rgb_to_gba_palette(rgb):
+    """Flat RGB888 palette -> GBA BGR555 bytes (top 5 bits per channel, as gbagfx)."""
+    channels = iter(rgb)
+    return struct.pack(
+        f"<{len(rgb) // 3}H",
+        *[(r >> 3) | ((g >> 3) << 5) | ((b >> 3) << 10) for r, g, b in zip(channels, channels, channels)]
+    )
+
+def _encode_card_graphics(pil_img):
+    """
+    Any square PIL image -> (6bpp gfx, BGR555 palette, 80x80 RGB master for
+    the icons). Pure Pillow work with no Tk or ROM access, so it is safe to
+    run on a worker thread; raises ValueError for a non-square image.
+    """
+    # --- Validate / resize to 80x80 ---
+    w, h = pil_img.size
+    if w != h:
+        raise ValueError(f"Image must be square. Got {w}x{h}.")
+
+    if pil_img.mode == "RGB" and "transparency" not in pil_img.info:
+        # Opaque (e.g. the YGOPRODeck JPEGs): flattening onto black would
+        # give back the same pixels, so skip the RGBA round trip
+        bg = pil_img.resize((80, 80), Image.LANCZOS)
+    else:
+        img = pil_img.convert("RGBA").resize((80, 80), Image.LANCZOS)
+
+        # Flatten alpha onto a solid background (e.g. transparent→black)
+        # so quantization doesn't depend on PNG alpha weirdness.
+        bg = Image.new("RGB", (80, 80), (0, 0, 0))
+        bg.paste(img, mask=img.getchannel("A"))
+
+    # This is the “master” card image for icons. Nothing below or in the
+    # icon pipeline draws on it (convert() returns a new image), so it is
+    # shared rather than copied.
+    card_rgb_80 = bg
+
+    # --- Quantize to 64 colors ---
+    img = bg.convert("P", palette=Image.ADAPTIVE, colors=64)
+
+    # --- Encode to 6bpp + GBA palette in process ---
+    # The custom gbagfx mirrored every 8-pixel tile row when writing
+    # 6bpp, which is why this import used to flip each tile first; the
+    # two flips cancel, so the tiles are packed exactly as they are.
+    gfx_data = _pack_8bpp_to_6bpp(_tile_8bpp(img.tobytes(), 80, 80))
+
+    # Adaptive quantizing can return fewer than 64 colours; pad the
+    # palette so the slot's unused entries are simply black
+    pal_data = _rgb_to_gba_palette(img.getpalette()[:64 * 3]).ljust(CARD_PAL_SIZE, b"\x00")
+    return gfx_data, pal_data, card_rgb_80
+
+_BCD_NON_DIGITS = str.maketrans("abcdef", "000000")
+
+def _decode_bcd_passwords(raw):
+    """
+    Packed 4-byte little-endian BCD passwords -> ints, with non-decimal
+    nibbles read as 0. Reversing the whole table puts every entry's bytes
+    in big-endian order (and the entries last to first), so one hex() call
+    yields all the digits.
+    """
+    digits = raw[::-1].hex().translate(_BCD_NON_DIGITS)
+    return [int(digits[k:k + 8]) for k in range(len(digits) - 8, -1, -8)]
+
+def _indexed_image(data_8bpp, rgb_pal, width, height):
+    """
+    Tiled 8bpp data + RGB palette (from _gba_palette_to_rgb) -> Pillow "P"
+    image, all in memory.
+    """
+    img = Image.frombytes("P", (width, height), _detile_8bpp(data_8bpp, width, height))
+    img.putpalette(rgb_pal)
+    return img
+
+
+class _FreeRunIndex:
+    """
+    Maximal runs of two or more zero bytes in buf[lo:hi], in address order.
+    Built once per save and kept in step with every text write, so free
+    space is found without rescanning the whole text block per string.
+    Lone zero bytes (mostly string terminators) are not indexed.
+    """
+    _ZERO_RUN = re.compile(rb"\x00{2,}")
+
+    def __init__(self, buf, lo, hi):
+        self.buf, self.lo, self.hi = buf, lo, hi
+        self.starts, self.ends = self._scan(lo, hi)
+
+    def copy_for(self, buf):
+        """Same runs over buf, a copy whose buf[lo:hi] still matches ours."""
+        runs = _FreeRunIndex.__new__(_FreeRunIndex)
+        runs.buf, runs.lo, runs.hi = buf, self.lo, self.hi
+        runs.starts, runs.ends = self.starts[:], self.ends[:]
+        return runs
+
+    def _scan(self, lo, hi):
+        starts, ends = [], []
+        for m in self._ZERO_RUN.finditer(self.buf, lo, hi):
+            starts.append(m.start())
+            ends.append(m.end())
+        return starts, ends
+
+    def first_fit(self, size):
+        """Start of the first run of at least size zero bytes, or -1."""
+        if size < 2:
+            return self.buf.find(0, self.lo, self.hi)
+        for start, end in zip(self.starts, self.ends):
+            if end - start >= size:
+                return start
+        return -1
+
+    def touch(self, lo, hi):
+        """Re-derive the runs around buf[lo:hi] after it was written."""
+        lo, hi = max(lo, self.lo), min(hi, self.hi)
+        if lo >= hi:
+            return
+        # Indexed runs overlapping or adjacent to the write
+        i = bisect_right(self.ends, lo - 1)
+        j = bisect_left(self.starts, hi + 1)
+        if i < j:
+            lo, hi = min(lo, self.starts[i]), max(hi, self.ends[j - 1])
+        # A lone zero just outside can now be part of a longer run
+        if lo > self.lo and self.buf[lo - 1] == 0:
+            lo -= 1
+        if hi < self.hi and self.buf[hi] == 0:
+            hi += 1
+        self.starts[i:j], self.ends[i:j] = self._scan(lo, hi)
+
 class ArtworkEntry:
+    __slots__ = ("index", "unk_halfword", "card_name_index")
+
     def __init__(self, index, unk_halfword, card_name_index):
         self.index = index                 # artwork slot index (0..2330)
         self.unk_halfword = unk_halfword   # first 2 bytes, unknown but editable
@@ -142,6 +404,19 @@ class PackEntry:
         self.original_contents_size = original_contents_size  # bytes
 
 class CardEntry:
+    # Thousands of these live for the whole session; slots drop the
+    # per-instance __dict__
+    __slots__ = (
+        "index",
+        "name", "desc", "text_dirty", "name_ptr_off", "desc_ptr_off",
+        "name_addr", "desc_addr", "name_slot_size", "desc_slot_size",
+        "konami_id", "card_id_index", "artwork_id", "edited_flag",
+        "atk", "deff", "level", "race", "attribute", "type_", "st_race", "padding",
+        "password", "price",
+        "second_stats_index", "konami2", "card_id_index2", "artwork2", "edited_flag2",
+        "atk2", "deff2", "level2", "race2", "attribute2", "type2", "st_race2", "padding2",
+    )
+
     def __init__(
         self, index,
         name, desc,
@@ -159,6 +434,7 @@ class CardEntry:
         # Text
         self.name = name
         self.desc = desc
+        self.text_dirty = False  # name/desc differ from the loaded ROM's strings
         self.name_ptr_off = name_ptr_off
         self.desc_ptr_off = desc_ptr_off
         self.name_addr = name_addr
@@ -208,8 +484,17 @@ class RomEditorApp(tk.Tk):
         self.rom_path = None
         self.rom_data = None
         self.cards = []
+        self.card_names = []               # card.name per card index (kept in sync, see _set_card_name)
+        self.card_names_lc = []            # same, lowercased for the list filter
+        self.card_name_trigrams = {}       # trigram -> card indices (see _build_trigram_index)
+        self.card_labels = []              # "0000: Name" list labels, same indexing
         self.current_index = None
         self.filtered_indices = []
+        self._row_of_card = {}         # card index -> listbox row, inverse of filtered_indices
+        self._card_filter = ""         # filter text filtered_indices was built from
+        self._filter_after_id = None   # pending debounced apply_filter
+        self._card_list_stale = True   # listbox labels need a refill (names changed)
+        self._card_id_choices_stale = True  # Card ID dropdowns need the new labels
 
         # Lookup text lists
         self.races_list = []
@@ -217,19 +502,32 @@ class RomEditorApp(tk.Tk):
         self.types_list = []
         self.st_races_list = []
 
+        # Reverse lookups (text -> index) for the lists above
+        self._races_index = {}
+        self._attributes_index = {}
+        self._types_index = {}
+        self._st_races_index = {}
+
         # Card ID dropdown choices ("0000: Name")
         self.card_id_choices = []
+        self._card_id_ui_index = {}  # Tk variable name -> card ID index shown in it
+        self._editor_snapshot = None  # _editor_state() as last loaded/applied
 
         # YGOPRODeck Konami ID -> name
         self.konami_name_map = {}
         self.ygo_cards_by_name = {}
         self.ygo_card_names = []
+        self.ygo_card_names_lc = []         # same names, lowercased for filtering
+        self.ygo_name_trigrams = {}         # trigram -> set of ygo_card_names indices
+        self._ygo_last_filter = {"pattern": "", "result": None}
+        self._konami_none_label_cache = {}  # konami_id -> "Name (None)" label
 
         # Trace guards
         self._updating_konami_main = False
         self._updating_konami_sec = False
 
         self.artworks = []                 # list[ArtworkEntry]
+        self._artwork_gfx_index = []       # artwork slot -> graphics index (0xFFFF = none)
         self.current_artwork_index = 0
         self._updating_artwork_index = False
 
@@ -238,9 +536,15 @@ class RomEditorApp(tk.Tk):
         self.decks = []                     # list[DeckEntry]
         self.konami_to_card_index = {}      # filled after parsing cards
         self.deck_card_choices = []         # "ID: Name" for deck dropdowns
+        self.deck_card_choices_tuple = ()   # same, as one shared immutable values object
+        self.deck_card_choices_lc = []      # same labels, lowercased for filtering
+        self.deck_card_choices_lc_b = None  # ASCII bytes of the above (None if not all ASCII)
+        self.deck_choice_trigrams = {}      # trigram -> set of deck choice indices
         self.deck_card_choice_konami = []   # konami_id list aligned with above
         self.konami_to_deck_choice_index = {}
+        self.konami_to_choice_arr = array("i", [-1]) * 0x10000  # same, as a flat table
         self.deck_names = []  # index -> name from text/decks.txt
+        self.deck_display_names = ()  # index -> name, or "Deck N" when unnamed
 
         self.password_to_konami = {}  # password (int) -> konami_id
 
@@ -248,7 +552,25 @@ class RomEditorApp(tk.Tk):
 
         self.packs = []          # list[PackEntry]
         self.pack_names = []     # from text/packs.txt
+        self.pack_display_names = ()  # index -> name, or "Pack N" when unnamed
         self.rarities = []       # from text/rarities.txt
+        self._rarities_index = {}  # rarity name -> index
+
+        # Decoded previews, so browsing back and forth doesn't decode again
+        self._card_image_cache = OrderedDict()  # gfx index -> PhotoImage (LRU)
+        self._card_icon_cache = OrderedDict()   # icon index -> (large, small, sideways) (LRU)
+        self._icon_quant_pal_cache = None       # (full_pal, tmp_pal_img, exact) for icon quantizing
+        self._icon_palette_rgb_cache = None     # (raw icon palette, RGB bytes)
+        self._icon_template_cache = {}          # (template path, size) -> RGBA template
+        self._icon_composite_cache = OrderedDict()  # (type, image digest) -> RGB icon composites (LRU)
+        self._icon_cache_lock = threading.Lock()    # composite LRU is shared with bulk-import workers
+        self._http_opener = urllib.request.build_opener()  # proxies from the environment, redirects
+        self._http_opener.addheaders = [("User-Agent", HTTP_USER_AGENT)]
+        self._http_conns = {}                   # (scheme, host) -> kept-alive HTTP(S)Connection (no proxy)
+        self._free_runs = None                  # _FreeRunIndex of the ROM copy being saved
+        self._text_refs = None                  # text address -> cards pointing at it, during a save
+        self._text_pinned = None                # text addresses with another string inside the slot
+        self._rom_free_runs = None              # _FreeRunIndex of the loaded ROM's text block
 
         self._load_text_mappings()
         self._load_json_mappings()
@@ -277,6 +599,7 @@ class RomEditorApp(tk.Tk):
             rarities = ["(None)"]
 
         self.rarities = rarities
+        self._rarities_index = self._index_map(rarities)
 
     def _load_pack_names(self):
         """
@@ -298,6 +621,7 @@ class RomEditorApp(tk.Tk):
             names = []
 
         self.pack_names = names
+        self.pack_display_names = self._display_names(names, NUM_PACKS, "Pack")
 
     def _write_deck_to_rom(self, deck: DeckEntry):
         """
@@ -364,6 +688,19 @@ class RomEditorApp(tk.Tk):
             names = []
 
         self.deck_names = names
+        self.deck_display_names = self._display_names(names, NUM_DECKS, "Deck")
+
+    @staticmethod
+    def _display_names(names, count, kind):
+        """
+        Names as shown in the editor lists, covering at least count indices:
+        the loaded name, or "<kind> <index>" where there is none.
+        """
+        total = max(count, len(names))
+        return tuple(
+            (names[i].strip() if i < len(names) else "") or f"{kind} {i}"
+            for i in range(total)
+        )
 
     def _write_name_sort_table(self, rom_data):
         """
@@ -385,50 +722,52 @@ class RomEditorApp(tk.Tk):
         if not self.cards:
             return
 
-        # 1) Build list of (name, index) for the included cards
-        included = []
-        for i, card in enumerate(self.cards[1:]):
-            if NAME_SORT_EXCLUDE_START <= i <= NAME_SORT_EXCLUDE_END:
-                continue  # skip these
-            included.append((card.name, i))
-
-        if not included:
-            return
+        # Card names in sort-table order (card 0 has no entry)
+        table_names = self.card_names[1:]
 
-        # 2) Sort by ASCII name
-        included.sort(key=lambda x: x[0])
+        # 1) Collect the distinct names of the included cards
+        names = set(table_names[:NAME_SORT_EXCLUDE_START])
+        names.update(table_names[NAME_SORT_EXCLUDE_END + 1:])
 
-        # 3) Assign an alphabetical rank to each unique name
-        #    same name => same rank
-        name_to_rank = {}
-        rank = 0
-        last_name = None
+        if not names:
+            return
 
-        for name, _idx in included:
-            if name != last_name:
-                # new unique name -> new rank
-                name_to_rank[name] = rank
-                rank += 1
-                last_name = name
-            # if name == last_name, it reuses the same rank
+        # 2) + 3) Sort only the distinct names (ASCII order); each one's
+        #    position is its rank, so same name => same rank
+        name_to_rank = {name: rank for rank, name in enumerate(sorted(names))}
 
         # 4) For each card index (0..len(self.cards)-1),
-        #    write its alphabetical index+1 at NAME_SORT_TABLE_BASE + i*2
-        for i, card in enumerate(self.cards[1:]):
-            # Skip excluded range entirely, leave whatever is currently in the ROM
-            if NAME_SORT_EXCLUDE_START <= i <= NAME_SORT_EXCLUDE_END:
-                continue
+        #    write its alphabetical index+1 at NAME_SORT_TABLE_BASE + i*2.
+        #    The table is built as a list and packed back in one go.
+        count = min(len(self.cards) - 1, (len(rom_data) - NAME_SORT_TABLE_BASE) // 2)
+        if count <= 0:
+            return
+        table_fmt = f"<{count}H"
+        rom_values = struct.unpack_from(table_fmt, rom_data, NAME_SORT_TABLE_BASE)
 
-            name = card.name
-            # Should always be present, but fall back to 0 if something is odd
-            rank = name_to_rank.get(name, 0)
-            sort_value = rank + 1  # 1-based, since 0 is unused
+        # Should always be present, but fall back to 0 if something is odd;
+        # +1 because sort values are 1-based (0 is unused)
+        values = [name_to_rank.get(name, 0) + 1 for name in islice(table_names, count)]
 
-            off = NAME_SORT_TABLE_BASE + i * 2
-            if off + 2 > len(rom_data):
-                break
+        # Excluded range: leave whatever is currently in the ROM
+        excluded = slice(NAME_SORT_EXCLUDE_START, NAME_SORT_EXCLUDE_END + 1)
+        values[excluded] = rom_values[excluded]
+
+        struct.pack_into(table_fmt, rom_data, NAME_SORT_TABLE_BASE, *values)
 
-            self._write_u16(rom_data, off, sort_value)
+    def _get_icon_template(self, tpl_path, size):
+        """
+        Icon template PNG as RGBA, resized to size if needed. Templates are
+        decoded once and kept; callers must copy before drawing on them.
+        """
+        key = (tpl_path, size)
+        tpl = self._icon_template_cache.get(key)
+        if tpl is None:
+            tpl = Image.open(tpl_path).convert("RGBA")
+            if tpl.size != size:
+                tpl = tpl.resize(size, Image.LANCZOS)
+            self._icon_template_cache[key] = tpl
+        return tpl
 
     def _get_icon_template_path(self, card, label: str) -> str:
         """
@@ -444,7 +783,7 @@ class RomEditorApp(tk.Tk):
         filename = f"{safe}_{label}.png"
         return os.path.join(IMAGES_DIR, filename)
 
-    def _import_icons_from_card_image(self, card, card_rgb_80: Image.Image):
+    def _import_icons_from_card_image(self, card, card_rgb_80: Image.Image, icon_idx=None):
         """
         From full card image (80x80 RGB), build and import:
           - Large icon (32x48, card shrunk to 30x30 at (1, 9))
@@ -455,38 +794,192 @@ class RomEditorApp(tk.Tk):
           - starting from a card sprite
           - pasting the type template PNG on top
           - quantizing to the shared icon palette
-          - encoding to 8bpp and writing into the icon tables
+          - tiling to 8bpp and writing into the icon tables
+
+        icon_idx defaults to the slot of the artwork currently shown.
         """
         if self.rom_data is None:
             return
 
-        icon_idx = self._get_gfx_index_from_current_artwork()
+        if icon_idx is None:
+            icon_idx = self._get_gfx_index_from_current_artwork()
         if icon_idx is None or icon_idx < 0:
             return
 
-        # Offsets in the icon tables
+        if self._icon_offsets(icon_idx) is None:
+            messagebox.showerror("Error", "Icon data would be written out of ROM bounds.")
+            return
+
+        try:
+            icon_data = self._encode_card_icons(card, card_rgb_80)
+        except FileNotFoundError as e:
+            messagebox.showerror("Error", f"Template not found:\n{e.filename}")
+            return
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to build icons:\n{e}")
+            return
+
+        self._write_icon_data(icon_idx, icon_data)
+
+    def import_icons_bulk(self, jobs):
+        """
+        Build and write icons for many cards at once. jobs is a list of
+        (icon_idx, card, card_rgb_80) tuples.
+
+        The per-card work (resizes, template pastes, quantizing) is Pillow
+        code that releases the GIL, so it runs on a thread pool; the ROM
+        writes happen afterwards on this thread, in job order.
+        Returns a list of (icon_idx, exception) for the jobs that failed.
+        """
+        if self.rom_data is None:
+            return []
+        jobs = list(jobs)
+
+        # Build the shared palette state once before any worker needs it
+        self._get_icon_quant_palettes()
+
+        with ThreadPoolExecutor(max_workers=os.cpu_count() or 1) as pool:
+            futures = [
+                pool.submit(self._encode_card_icons, card, card_rgb_80)
+                for _icon_idx, card, card_rgb_80 in jobs
+            ]
+
+        failures = []
+        for (icon_idx, _card, _img), future in zip(jobs, futures):
+            error = future.exception()
+            if error is None and not self._write_icon_data(icon_idx, future.result()):
+                error = IndexError(f"Icon slot {icon_idx} is out of ROM range")
+            if error is not None:
+                failures.append((icon_idx, error))
+        return failures
+
+    def regenerate_all_icons(self):
+        """
+        Rebuild every card's large, small and sideways icons from the card
+        art in the ROM, e.g. after editing the type template PNGs. Cards
+        that share a graphics slot share its icons; the first such card's
+        type picks the templates.
+        """
+        if self.rom_data is None or not self.cards:
+            messagebox.showinfo("No ROM", "Load a ROM first.")
+            return
+        if not messagebox.askyesno(
+            "Regenerate icons",
+            "Rebuild the icons of every card from its card art?\n"
+            "This overwrites all card icons in the ROM."
+        ):
+            return
+
+        jobs = []
+        seen = set()
+        for card in self.cards:
+            gfx_index = self._get_graphics_index_for_card(card)
+            if gfx_index is None or gfx_index in seen:
+                continue
+            seen.add(gfx_index)
+            art = self._card_art_image(gfx_index)
+            if art is not None:
+                jobs.append((gfx_index, card, art.convert("RGB")))
+
+        self.config(cursor="watch")
+        self.update_idletasks()
+        try:
+            failures = self.import_icons_bulk(jobs)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to build icons:\n{e}")
+            return
+        finally:
+            self.config(cursor="")
+
+        if self.current_index is not None:
+            self._render_card_icons(self.cards[self.current_index])
+
+        done = len(jobs) - len(failures)
+        if failures:
+            icon_idx, error = failures[0]
+            messagebox.showwarning(
+                "Icons regenerated",
+                f"Rebuilt {done} of {len(jobs)} icon slots.\n"
+                f"{len(failures)} failed, first: slot {icon_idx}: {error}"
+            )
+        else:
+            messagebox.showinfo("Icons regenerated", f"Rebuilt {done} icon slots.")
+
+    def _icon_offsets(self, icon_idx):
+        """(large_off, small_off) in the icon tables, or None if out of range."""
         large_off = LARGE_ICON_BASE + icon_idx * LARGE_ICON_SIZE
         small_off = SMALL_ICON_BASE + icon_idx * SMALL_ICON_ENTRY_SIZE
 
-        if (large_off + LARGE_ICON_SIZE > len(self.rom_data) or
+        if (icon_idx < 0 or
+            large_off + LARGE_ICON_SIZE > len(self.rom_data) or
             small_off + SMALL_ICON_ENTRY_SIZE > len(self.rom_data)):
-            messagebox.showerror("Error", "Icon data would be written out of ROM bounds.")
-            return
+            return None
+        return large_off, small_off
 
-        # --- prepare base sprites from the 80x80 card image ---
-        # Work in RGBA so we can paste under transparent templates
-        def _get_icon_template_path(self, card, label: str) -> str:
-            type_name = self.types_list[card.type_]
-            safe = type_name.replace(' ', '_').replace('/', '_').lower()
-            filename = f"{safe}_{label}.png"
-            return os.path.join(IMAGES_DIR, filename)
+    def _write_icon_data(self, icon_idx, icon_data):
+        """Write (large, small, sideways) 8bpp data for one icon slot."""
+        offsets = self._icon_offsets(icon_idx)
+        if offsets is None:
+            return False
+        large_off, small_off = offsets
+        large_data, small_data, small_side_data = icon_data
 
-        # Helper to build final icon using a template
-        card_rgba_80 = card_rgb_80.convert("RGBA")
-        large_sprite = card_rgba_80.resize((30, 30), Image.LANCZOS)
-        small_sprite = card_rgba_80.resize((14, 14), Image.LANCZOS)
-        small_side_sprite = small_sprite.rotate(-90, expand=False)  # 90° right
+        self.rom_data[large_off:large_off + LARGE_ICON_SIZE] = large_data
+        self.rom_data[small_off:small_off + SMALL_ICON_SIZE] = small_data
+        self.rom_data[small_off + SMALL_ICON_SIZE:small_off + SMALL_ICON_ENTRY_SIZE] = small_side_data
+        self._card_icon_cache.pop(icon_idx, None)
+        return True
+
+    def _encode_card_icons(self, card, card_rgb_80: Image.Image):
+        """
+        Build the three icons for card_rgb_80 and return their raw 8bpp
+        data as (large, small, sideways). Touches no widgets and doesn't
+        write the ROM, so it is safe to run on a worker thread.
+        """
+        large_icon_rgb, small_icon_rgb, small_side_icon_rgb = (
+            self._build_icon_composites(card, card_rgb_80)
+        )
+
+        # --- Quantize to the icon palette ---
+        large_p = self._quantize_to_icon_palette(large_icon_rgb)
+        small_p = self._quantize_to_icon_palette(small_icon_rgb)
+        small_side_p = self._quantize_to_icon_palette(small_side_icon_rgb)
+
+        # --- Tile the palette indices into raw 8bpp data ---
+        def encode_icon(img_p, fname, w, h, expected_size):
+            if img_p.mode != "P" or img_p.size != (w, h):
+                raise ValueError(f"{fname}: expected a {w}x{h} paletted image")
+            data = _tile_8bpp(img_p.tobytes(), w, h)
+            if len(data) != expected_size:
+                raise ValueError(
+                    f"{fname}: expected {expected_size:#x} bytes, got {len(data):#x}"
+                )
+            return data
+
+        return (
+            encode_icon(
+                large_p, "large_icon",
+                LARGE_ICON_WIDTH, LARGE_ICON_HEIGHT,
+                LARGE_ICON_SIZE
+            ),
+            encode_icon(
+                small_p, "small_icon",
+                SMALL_ICON_WIDTH, SMALL_ICON_HEIGHT,
+                SMALL_ICON_SIZE
+            ),
+            encode_icon(
+                small_side_p, "small_side_icon",
+                SMALL_ICON_WIDTH, SMALL_ICON_HEIGHT,
+                SMALL_ICON_SIZE
+            ),
+        )
 
+    def _build_icon_composites(self, card, card_rgb_80: Image.Image):
+        """
+        Template + card sprite composites (RGB) for the large, small and
+        sideways icons. Raises FileNotFoundError if a template is missing.
+        """
+        # Helper to build final icon using a template
         def build_icon_with_template(sprite: Image.Image,
                                      label: str,
                                      icon_w: int,
@@ -496,19 +989,9 @@ class RomEditorApp(tk.Tk):
             Start from the type template PNG, then paste the card sprite on top.
             """
             tpl_path = self._get_icon_template_path(card, label)
-            try:
-                tpl = Image.open(tpl_path).convert("RGBA")
-            except FileNotFoundError:
-                messagebox.showerror("Error", f"Template not found:\n{tpl_path}")
-                raise
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to load template {tpl_path}:\n{e}")
-                raise
-
-            if tpl.size != (icon_w, icon_h):
-                tpl = tpl.resize((icon_w, icon_h), Image.LANCZOS)
-
-            # Start from the template
+            tpl = self._get_icon_template(tpl_path, (icon_w, icon_h))
+
+            # Start from the template (a copy; the cached one stays clean)
             base = tpl.copy()
 
             # Paste sprite ON TOP of the template, preserving sprite alpha if present
@@ -519,101 +1002,57 @@ class RomEditorApp(tk.Tk):
             # Final icon to quantize: RGB
             return base.convert("RGB")
 
-        large_icon_rgb = build_icon_with_template(
-            large_sprite, "large",
-            LARGE_ICON_WIDTH, LARGE_ICON_HEIGHT,
-            (1, 9)
-        )
-        small_icon_rgb = build_icon_with_template(
-            small_sprite, "small",
-            SMALL_ICON_WIDTH, SMALL_ICON_HEIGHT,
-            (5, 5)
-        )
-        small_side_icon_rgb = build_icon_with_template(
-            small_side_sprite, "small_side",
-            SMALL_ICON_WIDTH, SMALL_ICON_HEIGHT,
-            (5, 5)
-        )
-
-        # --- Quantize to the icon palette ---
-        try:
-            large_p = self._quantize_to_icon_palette(large_icon_rgb)
-            small_p = self._quantize_to_icon_palette(small_icon_rgb)
-            small_side_p = self._quantize_to_icon_palette(small_side_icon_rgb)
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to quantize icons to icon palette:\n{e}")
-            return
-
-        # --- Encode with gbagfx to raw 8bpp data and write into ROM ---
-        import tempfile, subprocess, os
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            def encode_icon_png(img_p, fname, w, h, expected_size):
-                png_path = os.path.join(tmpdir, fname + ".png")
-                bin_path = os.path.join(tmpdir, fname + ".8bpp")
-
-                img_p.save(png_path)
-
-                cmd = [
-                    GBAGFX_PATH,
-                    png_path,
-                    bin_path,
-                    "-mwidth", str(w / 8),
-                ]
-                subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-
-                with open(bin_path, "rb") as f:
-                    data = f.read()
-                if len(data) != expected_size:
-                    raise ValueError(
-                        f"{fname}: expected {expected_size:#x} bytes, got {len(data):#x}"
-                    )
-                return data
+        # Re-importing the same picture for a card of the same type gives
+        # the same composites, so reuse them (keyed by a digest of the pixels)
+        composite_key = (card.type_, hashlib.md5(card_rgb_80.tobytes()).digest())
+        with self._icon_cache_lock:
+            composites = self._lru_get(self._icon_composite_cache, composite_key)
+        if composites is not None:
+            return composites
 
-            try:
-                large_data = encode_icon_png(
-                    large_p, "large_icon",
-                    LARGE_ICON_WIDTH, LARGE_ICON_HEIGHT,
-                    LARGE_ICON_SIZE
-                )
-                small_data = encode_icon_png(
-                    small_p, "small_icon",
-                    SMALL_ICON_WIDTH, SMALL_ICON_HEIGHT,
-                    SMALL_ICON_SIZE
-                )
-                small_side_data = encode_icon_png(
-                    small_side_p, "small_side_icon",
-                    SMALL_ICON_WIDTH, SMALL_ICON_HEIGHT,
-                    SMALL_ICON_SIZE
-                )
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to encode icons with gbagfx:\n{e}")
-                return
-
-        # Write into ROM
-        self.rom_data[large_off:large_off + LARGE_ICON_SIZE] = large_data
-        self.rom_data[small_off:small_off + SMALL_ICON_SIZE] = small_data
-        self.rom_data[small_off + SMALL_ICON_SIZE:small_off + SMALL_ICON_ENTRY_SIZE] = small_side_data
+        # --- prepare base sprites from the 80x80 card image ---
+        # Work in RGBA so we can paste under transparent templates
+        card_rgba_80 = card_rgb_80.convert("RGBA")
+        large_sprite = card_rgba_80.resize((30, 30), Image.LANCZOS)
+        # At 80 -> 14 the extra LANCZOS lobes don't survive quantizing
+        # to the icon palette; BILINEAR (still area-averaging when
+        # shrinking) is cheaper. The 30x30 large sprite keeps LANCZOS.
+        small_sprite = card_rgba_80.resize((14, 14), Image.BILINEAR)
+        small_side_sprite = small_sprite.transpose(Image.Transpose.ROTATE_270)  # 90° right
+
+        composites = (
+            build_icon_with_template(
+                large_sprite, "large",
+                LARGE_ICON_WIDTH, LARGE_ICON_HEIGHT,
+                (1, 9)
+            ),
+            build_icon_with_template(
+                small_sprite, "small",
+                SMALL_ICON_WIDTH, SMALL_ICON_HEIGHT,
+                (5, 5)
+            ),
+            build_icon_with_template(
+                small_side_sprite, "small_side",
+                SMALL_ICON_WIDTH, SMALL_ICON_HEIGHT,
+                (5, 5)
+            ),
+        )
+        with self._icon_cache_lock:
+            self._lru_put(self._icon_composite_cache, composite_key, composites)
+        return composites
 
     def _parse_artworks(self):
         data = self.rom_data
-        artworks = []
-        for i in range(NUM_CARDS):
-            off = ARTWORK_TABLE_BASE + i * 4
-            if off + 4 > len(data):
-                break
-
-            unk = self._read_u16(data, off)
+        count = max(0, min(NUM_CARDS, (len(data) - ARTWORK_TABLE_BASE) // 4))
+        # One unpack for the whole table, split into its two columns:
+        # unks = first halfword of each entry, stored = second halfword
+        # (a direct index into card names, or 0xFFFF for none)
+        halves = struct.unpack_from(f"<{count * 2}H", data, ARTWORK_TABLE_BASE)
+        unks = halves[0::2]
+        stored = halves[1::2]
 
-            stored = self._read_u16(data, off + 2)
-            if stored == 0xFFFF:
-                card_idx = 0xFFFF
-            else:
-                card_idx = stored  # direct index into card names
-
-            artworks.append(ArtworkEntry(i, unk, card_idx))
-
-        self.artworks = artworks
+        self.artworks = list(map(ArtworkEntry, range(count), unks, stored))
+        self._artwork_gfx_index = list(stored)
 
     def _decode_6bpp_to_8bpp(self, data_6bpp: bytes) -> bytes:
         """
@@ -630,23 +1069,24 @@ class RomEditorApp(tk.Tk):
 
         Each 6-bit value (0..63) is stored in a full byte so gbagfx
         can treat it as 8bpp indexed data.
+
+        Rather than looping per group, the 3-byte groups are spread into
+        32-bit words with strided slice copies, and the whole image is then
+        unpacked as one big integer: field k of every word moves up by 2*k
+        bits and is masked into its own byte.
         """
         if len(data_6bpp) != CARD_GFX_SIZE:
             raise ValueError(f"Expected {CARD_GFX_SIZE} bytes of 6bpp data, got {len(data_6bpp)}")
 
-        out = bytearray()
+        words = bytearray(_CARD_PIXEL_WORDS * 4)
+        words[0::4] = data_6bpp[0::3]
+        words[1::4] = data_6bpp[1::3]
+        words[2::4] = data_6bpp[2::3]
 
-        for i in range(0, len(data_6bpp), 3):
-            a = data_6bpp[i]
-            b = data_6bpp[i + 1]
-            c = data_6bpp[i + 2]
-
-            v = a | (b << 8) | (c << 16)
-
-            out.append((v >> 0)  & 0x3F)
-            out.append((v >> 6)  & 0x3F)
-            out.append((v >> 12) & 0x3F)
-            out.append((v >> 18) & 0x3F)
+        v = int.from_bytes(words, "little")
+        m0, m1, m2, m3 = _UNPACK_6BPP_MASKS
+        v = (v & m0) | ((v << 2) & m1) | ((v << 4) & m2) | ((v << 6) & m3)
+        out = v.to_bytes(len(words), "little")
 
         if len(out) != 80 * 80:
             raise ValueError(f"Decoded 6bpp length mismatch: {len(out)} pixels")
@@ -656,8 +1096,8 @@ class RomEditorApp(tk.Tk):
     def _render_card_image(self, card: CardEntry):
         """
         Extracts this card's 6bpp art and palette from the ROM,
-        converts to 8bpp, runs gbagfx to make a PNG, horizontally
-        flips it with Pillow, and displays it in the Tkinter label.
+        converts to 8bpp, untiles it into a Pillow image in memory,
+        and displays it in the Tkinter label.
         """
         if self.rom_data is None:
             self.card_image_label.config(image="", text="(no ROM)")
@@ -670,62 +1110,74 @@ class RomEditorApp(tk.Tk):
             self.card_photo = None
             return
 
-        # --- Compute ROM offsets for this graphic + palette ---
+        cached = self._lru_get(self._card_image_cache, gfx_index)
+        if cached is not None:
+            self.card_photo = cached
+            self.card_image_label.config(image=cached, text="")
+            return
+
+        # --- Build the image in memory and show in Tkinter ---
+        try:
+            img = self._card_art_image(gfx_index)
+            if img is None:
+                self.card_image_label.config(image="", text="(art out of range)")
+                self.card_photo = None
+                return
+            self.card_photo = ImageTk.PhotoImage(img)
+            self.card_image_label.config(image=self.card_photo, text="")
+            self._lru_put(self._card_image_cache, gfx_index, self.card_photo)
+        except Exception:
+            traceback.print_exc()
+            self.card_image_label.config(image="", text="(image load error)")
+            self.card_photo = None
+
+    def _card_art_image(self, gfx_index):
+        """
+        80x80 'P' image of the card art in graphics slot gfx_index (same
+        pixels and palette gbagfx would write to a PNG), or None if the
+        slot lies outside the ROM.
+        """
         gfx_off = CARD_GFX_BASE + gfx_index * CARD_GFX_SIZE
         pal_off = CARD_PAL_BASE + gfx_index * CARD_PAL_SIZE
-
         if gfx_off + CARD_GFX_SIZE > len(self.rom_data) or pal_off + CARD_PAL_SIZE > len(self.rom_data):
-            self.card_image_label.config(image="", text="(art out of range)")
-            self.card_photo = None
-            return
+            return None
 
         data_6bpp = bytes(self.rom_data[gfx_off:gfx_off + CARD_GFX_SIZE])
         pal_raw  = bytes(self.rom_data[pal_off:pal_off + CARD_PAL_SIZE])
 
         # --- Convert 6bpp → 8bpp ---
         data_8bpp = self._decode_6bpp_to_8bpp(data_6bpp)
+        return _indexed_image(data_8bpp, _gba_palette_to_rgb(pal_raw), 80, 80)
 
-        # --- Prepare temp files for gbagfx ---
-        with tempfile.TemporaryDirectory() as tmpdir:
-            gfx_path = os.path.join(tmpdir, "card.8bpp")
-            pal_path = os.path.join(tmpdir, "card.gbapal")
-            png_path = os.path.join(tmpdir, "card.png")
-
-            # Write 6400 bytes of 8bpp index data
-            with open(gfx_path, "wb") as f:
-                f.write(data_8bpp)
-
-            # gbagfx expects a 256-color palette (0x200 bytes) for 8bpp;
-            # we have 64 entries (0x80 bytes), so just pad with zeros.
-            pal_data = pal_raw + b"\x00" * (0x200 - len(pal_raw))
-            with open(pal_path, "wb") as f:
-                f.write(pal_data)
-
-            # --- Call gbagfx to build the PNG ---
-            # Adjust flags if your gbagfx version uses different syntax.
-            cmd = [
-                GBAGFX_PATH,
-                gfx_path,
-                png_path,
-                "-palette", pal_path,
-                "-mwidth", "10",
-            ]
-
-            try:
-                subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            except Exception as e:
-                traceback.print_exc()
-                self.card_photo = None
-                return
+    @staticmethod
+    def _lru_get(cache, key):
+        """Return cache[key] (marking it most recently used), or None."""
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
 
-            # --- Open PNG, flip horizontally, and show in Tkinter ---
-            try:
-                img = Image.open(png_path)
-                self.card_photo = ImageTk.PhotoImage(img)
-                self.card_image_label.config(image=self.card_photo, text="")
-            except Exception:
-                self.card_image_label.config(image="", text="(image load error)")
-                self.card_photo = None
+    @staticmethod
+    def _lru_put(cache, key, value):
+        """Insert into an OrderedDict LRU, evicting past IMAGE_CACHE_SIZE."""
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > IMAGE_CACHE_SIZE:
+            cache.popitem(last=False)
+
+    def _clear_rom_caches(self):
+        """Drop everything derived from the previous ROM's bytes."""
+        self._card_image_cache.clear()
+        self._card_icon_cache.clear()
+        if hasattr(self, "_icon_palette_cache"):
+            del self._icon_palette_cache
+        self._icon_quant_pal_cache = None
+        self._icon_palette_rgb_cache = None
+        self._rom_free_runs = None
+        # Not ROM data, but reopening a ROM is the natural point to pick up
+        # edited template PNGs
+        self._icon_template_cache.clear()
+        self._icon_composite_cache.clear()
 
     def _get_graphics_index_for_card(self, card: CardEntry):
         """
@@ -742,12 +1194,12 @@ class RomEditorApp(tk.Tk):
         if slot < 0:
             return None
 
-        # Second halfword of artwork entry = Card (Name Index) (0-based)
-        off = ARTWORK_TABLE_BASE + slot * 4 + 2
-        if off + 2 > len(self.rom_data):
+        # Second halfword of artwork entry = Card (Name Index) (0-based),
+        # as parsed by _parse_artworks
+        if slot >= len(self._artwork_gfx_index):
             return None
 
-        gfx_index = self._read_u16(self.rom_data, off)  # 0..2330
+        gfx_index = self._artwork_gfx_index[slot]  # 0..2330
         if not (0 <= gfx_index < NUM_CARD_GFX):
             return None
 
@@ -757,6 +1209,17 @@ class RomEditorApp(tk.Tk):
     # LOAD TEXT / JSON MAPPINGS
     # =========================
 
+    @staticmethod
+    def _index_map(values):
+        """
+        Build a {value: index} dict for a lookup list. Duplicates keep their
+        first index, same as values.index(value).
+        """
+        mapping = {}
+        for i, value in enumerate(values):
+            mapping.setdefault(value, i)
+        return mapping
+
     def _load_text_mappings(self):
         try:
             base_dir = os.path.dirname(os.path.abspath(__file__))
@@ -778,6 +1241,12 @@ class RomEditorApp(tk.Tk):
         # NEW: artwork names (one per line, 2331 total)
         self.artwork_names = load_lines(os.path.join("..", "text", "card_graphics_indexes.txt"))
 
+        self._races_index = self._index_map(self.races_list)
+        self._attributes_index = self._index_map(self.attributes_list)
+        self._types_index = self._index_map(self.types_list)
+        self._st_races_index = self._index_map(self.st_races_list)
+        self._artwork_names_index = self._index_map(self.artwork_names)
+
     def _load_json_mappings(self):
         try:
             base_dir = os.path.dirname(os.path.abspath(__file__))
@@ -827,6 +1296,8 @@ class RomEditorApp(tk.Tk):
         self.konami_name_map = mapping
         self.ygo_cards_by_name = ygo_by_name
         self.ygo_card_names = sorted(ygo_names, key=str.lower)
+        self.ygo_card_names_lc = [n.lower() for n in self.ygo_card_names]
+        self.ygo_name_trigrams = self._build_trigram_index(self.ygo_card_names_lc)
 
     def _load_set_chronology(self):
         """
@@ -904,7 +1375,15 @@ class RomEditorApp(tk.Tk):
             clear_icons("(no icon)")
             return
 
-        pal_data = self._get_icon_palette()
+        cached = self._lru_get(self._card_icon_cache, icon_idx)
+        if cached is not None:
+            self.large_icon_photo, self.small_icon_photo, self.small_side_icon_photo = cached
+            self.large_icon_label.config(image=self.large_icon_photo, text="")
+            self.small_icon_label.config(image=self.small_icon_photo, text="")
+            self.small_side_icon_label.config(image=self.small_side_icon_photo, text="")
+            return
+
+        pal_data = self._get_icon_palette_rgb()
         if pal_data is None:
             clear_icons("(no palette)")
             return
@@ -923,63 +1402,43 @@ class RomEditorApp(tk.Tk):
         small_reg_data = small_entry[:SMALL_ICON_SIZE]
         small_side_data = small_entry[SMALL_ICON_SIZE:SMALL_ICON_ENTRY_SIZE]
 
-        # gbagfx expects a 256-color palette (0x200 bytes) for 8bpp; pad with zeros.
-        pal_256 = pal_data + b"\x00" * (0x200 - len(pal_data))
-
         try:
             self.large_icon_photo = self._decode_icon_to_photoimage(
-                card, 'large', large_data, pal_256, LARGE_ICON_WIDTH, LARGE_ICON_HEIGHT
+                card, 'large', large_data, pal_data, LARGE_ICON_WIDTH, LARGE_ICON_HEIGHT
             )
             self.small_icon_photo = self._decode_icon_to_photoimage(
-                card, 'small', small_reg_data, pal_256, SMALL_ICON_WIDTH, SMALL_ICON_HEIGHT
+                card, 'small', small_reg_data, pal_data, SMALL_ICON_WIDTH, SMALL_ICON_HEIGHT
             )
             self.small_side_icon_photo = self._decode_icon_to_photoimage(
-                card, 'small_side', small_side_data, pal_256, SMALL_ICON_WIDTH, SMALL_ICON_HEIGHT
+                card, 'small_side', small_side_data, pal_data, SMALL_ICON_WIDTH, SMALL_ICON_HEIGHT
             )
         except Exception:
             clear_icons("(decode error)")
             return
 
+        self._lru_put(
+            self._card_icon_cache, icon_idx,
+            (self.large_icon_photo, self.small_icon_photo, self.small_side_icon_photo)
+        )
+
         # Attach to labels
         self.large_icon_label.config(image=self.large_icon_photo, text="")
         self.small_icon_label.config(image=self.small_icon_photo, text="")
         self.small_side_icon_label.config(image=self.small_side_icon_photo, text="")
 
-    def _decode_icon_to_photoimage(self, card: CardEntry, label: str, gfx_data: bytes, pal_256: bytes,
+    def _decode_icon_to_photoimage(self, card: CardEntry, label: str, gfx_data: bytes, pal_data: bytes,
                                    width: int, height: int) -> ImageTk.PhotoImage:
         """
-        Take raw 8bpp tile data + GBA-format palette and turn it into
-        a Tk PhotoImage via gbagfx + Pillow.
+        Take raw 8bpp tile data + an RGB palette (already converted from
+        the GBA format) and turn it into a Tk PhotoImage with Pillow.
         """
-        import tempfile, os
-
         if len(gfx_data) != width * height:
             # If this happens, your width/height constants are wrong.
             raise ValueError("Icon size mismatch for given dimensions")
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            gfx_path = os.path.join(tmpdir, "icon.8bpp")
-            pal_path = os.path.join(tmpdir, "icon.gbapal")
-            png_path = os.path.join(tmpdir, "icon.png")
-
-            with open(gfx_path, "wb") as f:
-                f.write(gfx_data)
-            with open(pal_path, "wb") as f:
-                f.write(pal_256)
-
-            cmd = [
-                GBAGFX_PATH,
-                gfx_path,
-                png_path,
-                "-palette", pal_path,
-                "-mwidth", str(width / 8),
-            ]
-
-            subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-
-            img = Image.open(png_path)
-            # No flips/rotations here unless you *want* to adjust sideways icon visually.
-            return ImageTk.PhotoImage(img)
+        img = _indexed_image(gfx_data, pal_data, width, height)
+        # No flips/rotations here unless you *want* to adjust sideways icon visually.
+        return ImageTk.PhotoImage(img)
 
     def import_from_ygoprodeck(self):
         if self.rom_data is None or not self.cards:
@@ -1016,8 +1475,8 @@ class RomEditorApp(tk.Tk):
         desc = card_info.get("desc") or card.desc
         ygo_id = card_info.get("id")
 
-        card.name = card_name
-        card.desc = desc
+        self._set_card_name(card, card_name)
+        self._set_card_desc(card, desc)
 
         # Password: YGOPRODeck 'id' is numeric; we treat it as the decimal password
         try:
@@ -1050,23 +1509,20 @@ class RomEditorApp(tk.Tk):
             # with ATK/DEF/Level set to 0. Spell/Trap race from YGOPRO 'race'.
             base_type_name = "Spell Card" if is_spell else "Trap Card"
 
+            # Name -> index via the maps built in _load_text_mappings;
+            # names missing from a list leave the current value alone.
+
             # Type
-            if base_type_name in self.types_list:
-                card.type_ = self.types_list.index(base_type_name)
+            card.type_ = self._types_index.get(base_type_name, card.type_)
 
             # Race (monster race field)
-            if base_type_name in self.races_list:
-                card.race = self.races_list.index(base_type_name)
+            card.race = self._races_index.get(base_type_name, card.race)
 
             # Attribute
-            if base_type_name in self.attributes_list:
-                card.attribute = self.attributes_list.index(base_type_name)
+            card.attribute = self._attributes_index.get(base_type_name, card.attribute)
 
             # Spell/Trap Race (Normal, Continuous, Equip, etc.)
-            if race_str in self.st_races_list:
-                card.st_race = self.st_races_list.index(race_str)
-            else:
-                card.st_race = 0
+            card.st_race = self._st_races_index.get(race_str, 0)
 
             card.atk = 0
             card.deff = 0
@@ -1076,23 +1532,19 @@ class RomEditorApp(tk.Tk):
             if human_type_str == 'Fusion Effect Monster':
                 type_str = human_type_str
 
-            if type_str in self.types_list:
-                card.type_ = self.types_list.index(type_str)
-
-            if race_str in self.races_list:
-                card.race = self.races_list.index(race_str)
-
-            if attr_str in self.attributes_list:
-                card.attribute = self.attributes_list.index(attr_str)
+            card.type_ = self._types_index.get(type_str, card.type_)
+            card.race = self._races_index.get(race_str, card.race)
+            card.attribute = self._attributes_index.get(attr_str, card.attribute)
 
             # Not a spell/trap, so spell/trap race is 0
             card.st_race = 0
 
-            # ATK / DEF: -1 means "?" → 65535 in the ROM
+            # ATK / DEF: -1 means "?" → 65535 in the ROM, which the 16-bit
+            # mask gives directly (YGOPRODeck uses no other negatives)
             if isinstance(atk_val, int):
-                card.atk = 65535 if atk_val == -1 else max(0, atk_val) & 0xFFFF
+                card.atk = atk_val & 0xFFFF
             if isinstance(def_val, int):
-                card.deff = 65535 if def_val == -1 else max(0, def_val) & 0xFFFF
+                card.deff = def_val & 0xFFFF
 
             if isinstance(lvl_val, int):
                 card.level = lvl_val & 0xFFFF
@@ -1125,19 +1577,101 @@ class RomEditorApp(tk.Tk):
             first_img = images[0] or {}
             image_url = first_img.get("image_url_cropped") or first_img.get("image_url")
 
-        if image_url:
-            try:
-                resp = urlopen(image_url)
-                data = resp.read()
-                pil_img = Image.open(BytesIO(data))
-                # Use the same pipeline as your "Load Card Graphics..." feature
-                self._import_card_graphics_from_pil(card, pil_img)
-            except Exception as e:
-                messagebox.showerror("Image Error", f"Failed to download or import card image:\n{e}")
-
         # Refresh UI from updated CardEntry
         self._load_card_into_editor(self.current_index)
 
+        if image_url:
+            # Download, decode and quantize on a worker thread so the editor
+            # stays responsive for the network round trip; the ROM is only
+            # written back on the Tk thread in _finish_ygo_import. The button
+            # stays disabled meanwhile, so one worker at a time uses the
+            # kept-alive connections in _http_get.
+            gfx_index = self._get_gfx_index_from_current_artwork()
+            self.ygo_import_button.config(state=tk.DISABLED, text="Downloading...")
+            threading.Thread(
+                target=self._ygo_image_worker,
+                args=(card, gfx_index, image_url),
+                daemon=True,
+            ).start()
+
+    def _ygo_image_worker(self, card, gfx_index, image_url):
+        encoded, error = None, None
+        try:
+            data = self._http_get(image_url)
+            # Same pipeline as the "Load Card Graphics..." feature
+            encoded = _encode_card_graphics(Image.open(BytesIO(data)))
+        except Exception as e:
+            error = e
+        try:
+            self.after(0, self._finish_ygo_import, card, gfx_index, encoded, error)
+        except (RuntimeError, tk.TclError):
+            pass  # app closed while we were downloading
+
+    def _finish_ygo_import(self, card, gfx_index, encoded, error):
+        self.ygo_import_button.config(state=tk.NORMAL, text="Import")
+        if error is not None:
+            messagebox.showerror("Image Error", f"Failed to download or import card image:\n{error}")
+            return
+        # A different ROM may have been opened while the image downloaded
+        if not (card.index < len(self.cards) and self.cards[card.index] is card):
+            return
+        self._write_card_graphics(card, *encoded, gfx_index=gfx_index)
+
+    def _http_get(self, url):
+        """
+        GET url and return the response body. Hosts reached directly keep
+        one connection each, so successive card image downloads skip the
+        TCP/TLS setup. When a proxy applies (HTTP(S)_PROXY, minus NO_PROXY)
+        the request goes through the shared urllib opener instead.
+        Follows redirects; raises OSError on a non-200 answer.
+        """
+        for _ in range(HTTP_MAX_REDIRECTS + 1):
+            parts = urlsplit(url)
+            if parts.scheme not in ("http", "https"):
+                raise ValueError(f"Unsupported URL: {url}")
+            if (parts.scheme in urllib.request.getproxies()
+                    and not urllib.request.proxy_bypass(parts.hostname or "")):
+                with self._http_opener.open(url, timeout=HTTP_TIMEOUT) as resp:
+                    return resp.read()
+
+            key = (parts.scheme, parts.netloc)
+            target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+
+            while True:
+                conn = self._http_conns.get(key)
+                reused = conn is not None
+                if conn is None:
+                    conn_cls = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+                    conn = self._http_conns[key] = conn_cls(parts.netloc, timeout=HTTP_TIMEOUT)
+                try:
+                    conn.request("GET", target, headers={"User-Agent": HTTP_USER_AGENT})
+                    resp = conn.getresponse()
+                    body = resp.read()
+                    break
+                except (OSError, http.client.HTTPException):
+                    conn.close()
+                    self._http_conns.pop(key, None)
+                    # A kept-alive socket may have been dropped by the server
+                    # while idle; retry once on a fresh connection
+                    if not reused:
+                        raise
+
+            if resp.will_close:
+                conn.close()
+                self._http_conns.pop(key, None)
+
+            if resp.status in (301, 302, 303, 307, 308):
+                location = resp.getheader("Location")
+                if not location:
+                    raise OSError(f"HTTP {resp.status} without a Location for {url}")
+                url = urljoin(url, location)
+                continue
+            if resp.status != 200:
+                raise OSError(f"HTTP {resp.status} {resp.reason} for {url}")
+            return body
+
+        raise OSError(f"Too many redirects for {url}")
+
     def _import_card_graphics_from_pil(self, card, pil_img):
         """
         Shared pipeline to take any PIL image and:
@@ -1146,89 +1680,19 @@ class RomEditorApp(tk.Tk):
           - import the main card graphic (6bpp + palette)
           - generate/update icons (large + 2 small) using your templates
         """
-        # This is basically the body of your existing load_card_graphics method,
-        # but starting from a PIL image instead of a file path.
-
-        # Example sketch (adapt to your current implementation):
-        img = pil_img.convert("RGBA")
-
-        # --- Validate / resize to 80x80 ---
-        w, h = img.size
-        if w != h:
-            messagebox.showerror("Error", f"Image must be square. Got {w}x{h}.")
+        try:
+            encoded = _encode_card_graphics(pil_img)
+        except ValueError as e:
+            messagebox.showerror("Error", str(e))
             return
+        self._write_card_graphics(card, *encoded)
 
-        img = img.resize((80, 80), Image.LANCZOS)
-
-        # Flatten alpha onto a solid background (e.g. transparent→black)
-        # so quantization doesn't depend on PNG alpha weirdness.
-        bg = Image.new("RGB", (80, 80), (0, 0, 0))
-        bg.paste(img, mask=img.split()[3])  # use alpha channel as mask
-        
-        # This is the “master” card image for icons
-        card_rgb_80 = bg.copy()
-        
-        img = bg  # now RGB
-
-        # --- Quantize to 64 colors ---
-        img = img.convert("P", palette=Image.ADAPTIVE, colors=64)
-
-        # --- Flip each 8x8 tile horizontally ---
-        pixels = img.load()
-        for ty in range(0, 80, 8):       # tile rows
-            for tx in range(0, 80, 8):   # tile columns
-                for y in range(8):
-                    for x in range(4):   # swap pairs within tile row
-                        x1 = tx + x
-                        x2 = tx + (7 - x)
-                        p1 = pixels[x1, ty + y]
-                        p2 = pixels[x2, ty + y]
-                        pixels[x1, ty + y] = p2
-                        pixels[x2, ty + y] = p1
-
-        # --- Run your custom gbagfx to generate 6bpp and palette ---
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmp_png = os.path.join(tmpdir, "card_in.png")
-            tmp_gfx = os.path.join(tmpdir, "card_in.6bpp")
-            tmp_pal = os.path.join(tmpdir, "card_in.gbapal")
-
-            img.save(tmp_png)
-
-            cmd = [
-                GBAGFX_PATH,
-                tmp_png,
-                tmp_gfx,
-                "-mwidth", "10",
-            ]
-
-            try:
-                res = subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            except Exception as e:
-                messagebox.showerror("Error", f"gbagfx failed:\n{e}")
-                return
-            
-            cmd = [
-                GBAGFX_PATH,
-                tmp_png,
-                tmp_pal,
-            ]
-
-            try:
-                res = subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-            except Exception as e:
-                messagebox.showerror("Error", f"gbagfx failed:\n{e}")
-                return
-
-            # --- Read back 6bpp data + palette ---
-            try:
-                with open(tmp_gfx, "rb") as f:
-                    gfx_data = f.read()
-                with open(tmp_pal, "rb") as f:
-                    pal_data = f.read()
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to read gbagfx output:\n{e}")
-                return
-
+    def _write_card_graphics(self, card, gfx_data, pal_data, card_rgb_80, gfx_index=None):
+        """
+        Write an encoded card graphic (see _encode_card_graphics) into its
+        graphics/palette slot and regenerate the card's icons. gfx_index
+        defaults to the slot of the artwork currently shown.
+        """
         # Sanity checks
         if len(gfx_data) != CARD_GFX_SIZE:
             messagebox.showerror(
@@ -1244,7 +1708,8 @@ class RomEditorApp(tk.Tk):
             )
             return
         
-        gfx_index = self._get_gfx_index_from_current_artwork()
+        if gfx_index is None:
+            gfx_index = self._get_gfx_index_from_current_artwork()
         if gfx_index is None:
             messagebox.showerror("Error", "Could not resolve Card (Name Index) / graphics index.")
             return
@@ -1262,6 +1727,7 @@ class RomEditorApp(tk.Tk):
         # --- Write into ROM (only first 0x80 bytes of palette are used per entry) ---
         self.rom_data[gfx_off:gfx_off + CARD_GFX_SIZE] = gfx_data
         self.rom_data[pal_off:pal_off + CARD_PAL_SIZE] = pal_data[:CARD_PAL_SIZE]
+        self._card_image_cache.pop(gfx_index, None)
 
         messagebox.showinfo(
             "Card graphics updated",
@@ -1269,10 +1735,13 @@ class RomEditorApp(tk.Tk):
         )
 
         # After writing gfx/pal for the main 6bpp artwork:
-        card = self.cards[self.current_index]
-        self._import_icons_from_card_image(card, card_rgb_80)
+        # (same slot as the art, even if the Artwork tab moved on meanwhile)
+        self._import_icons_from_card_image(card, card_rgb_80, gfx_index)
 
         # Optionally refresh your preview image, if you already have that hooked up
+        # (skipped when another card was selected while a download ran)
+        if self.current_index != card.index:
+            return
         try:
             # Replace this with whatever function you're using now to draw the card art
             self._render_card_image(card)
@@ -1285,10 +1754,25 @@ class RomEditorApp(tk.Tk):
         if not hasattr(self, "ygo_card_names"):
             return
         pattern = self.ygo_import_var.get().lower()
+        last = self._ygo_last_filter
         if not pattern:
+            matches = None
             filtered = self.ygo_card_names
         else:
-            filtered = [n for n in self.ygo_card_names if pattern in n.lower()]
+            # If the new pattern extends the previous one, only the previous
+            # matches can still match.
+            # Otherwise let the trigram index rule out most names up front.
+            if last["result"] is not None and last["pattern"] and pattern.startswith(last["pattern"]):
+                candidates = last["result"]
+            else:
+                candidates = self._trigram_candidates(self.ygo_name_trigrams, pattern)
+                if candidates is None:
+                    candidates = range(len(self.ygo_card_names_lc))
+            lower = self.ygo_card_names_lc
+            matches = [i for i in candidates if pattern in lower[i]]
+            names = self.ygo_card_names
+            filtered = [names[i] for i in matches]
+        self._ygo_last_filter = {"pattern": pattern, "result": matches}
         self.ygo_import_combo["values"] = filtered
         # Optional: expand dropdown as you type
         # self.ygo_import_combo.event_generate("<Down>")
@@ -1306,6 +1790,19 @@ class RomEditorApp(tk.Tk):
                 )
         return self._icon_palette_cache
 
+    def _get_icon_palette_rgb(self):
+        """
+        Shared icon palette converted to RGB once, for every icon decode
+        (three per card view) until the palette bytes change.
+        """
+        pal_data = self._get_icon_palette()
+        if pal_data is None:
+            return None
+        cached = self._icon_palette_rgb_cache
+        if cached is None or cached[0] != pal_data:
+            cached = self._icon_palette_rgb_cache = (pal_data, _gba_palette_to_rgb(pal_data))
+        return cached[1]
+
     def open_deck_editor(self):
         if self.rom_data is None or not self.cards:
             messagebox.showinfo("No ROM", "Load a ROM first.")
@@ -1342,6 +1839,11 @@ class RomEditorApp(tk.Tk):
         deck_menu.add_command(label="Pack Editor...", command=self.open_pack_editor)
         menubar.add_cascade(label="Other Editors", menu=deck_menu)
 
+        # Tools menu
+        tools_menu = tk.Menu(menubar, tearoff=False)
+        tools_menu.add_command(label="Regenerate All Card Icons...", command=self.regenerate_all_icons)
+        menubar.add_cascade(label="Tools", menu=tools_menu)
+
         self.config(menu=menubar)
 
         # Main layout
@@ -1360,6 +1862,7 @@ class RomEditorApp(tk.Tk):
         search_entry = tk.Entry(search_frame, textvariable=self.search_var, width=20)
         search_entry.pack(side=tk.LEFT, padx=(3, 3))
         search_entry.bind("<Return>", lambda e: self.apply_filter())
+        search_entry.bind("<KeyRelease>", self._schedule_filter)
         tk.Button(search_frame, text="Apply", command=self.apply_filter).pack(side=tk.LEFT)
         tk.Button(search_frame, text="Clear", command=self.clear_filter).pack(side=tk.LEFT, padx=(3, 0))
 
@@ -1434,11 +1937,12 @@ class RomEditorApp(tk.Tk):
         # Filter as you type
         self.ygo_import_combo.bind("<KeyRelease>", self._on_ygo_import_filter)
 
-        tk.Button(
+        self.ygo_import_button = tk.Button(
             import_frame,
             text="Import",
             command=self.import_from_ygoprodeck
-        ).pack(side=tk.LEFT)
+        )
+        self.ygo_import_button.pack(side=tk.LEFT)
 
         # Description
         desc_frame = tk.Frame(right_frame)
@@ -1523,6 +2027,10 @@ class RomEditorApp(tk.Tk):
         self.card_id_main_combo = ttk.Combobox(stats_main_frame, textvariable=self.card_id_main_var,
                                                state="readonly", width=30)
         self.card_id_main_combo.grid(row=row, column=1, sticky="w", padx=2, pady=1)
+        self.card_id_main_combo.bind(
+            "<<ComboboxSelected>>",
+            lambda e: self._on_card_id_selected(self.card_id_main_combo, self.card_id_main_var)
+        )
         row += 1
         self.artwork_main_entry = add_numeric_row(stats_main_frame, row, "Artwork #:", self.artwork_main_var); row += 1
         self.edited_main_entry = add_numeric_row(stats_main_frame, row, "Edited Art Flag:", self.edited_main_var); row += 1
@@ -1546,6 +2054,10 @@ class RomEditorApp(tk.Tk):
         self.card_id_sec_combo = ttk.Combobox(stats_sec_frame, textvariable=self.card_id_sec_var,
                                               state="readonly", width=30)
         self.card_id_sec_combo.grid(row=row, column=1, sticky="w", padx=2, pady=1)
+        self.card_id_sec_combo.bind(
+            "<<ComboboxSelected>>",
+            lambda e: self._on_card_id_selected(self.card_id_sec_combo, self.card_id_sec_var)
+        )
         row += 1
         self.artwork_sec_entry = add_numeric_row(stats_sec_frame, row, "Artwork #:", self.artwork_sec_var); row += 1
         self.edited_sec_entry = add_numeric_row(stats_sec_frame, row, "Edited Art Flag:", self.edited_sec_var); row += 1
@@ -1811,12 +2323,15 @@ class RomEditorApp(tk.Tk):
 
         # --- header ---
         off = pack.struct_off
-        self._write_u16(rom, off + 0,  pack.cost & 0xFFFF)
-        self._write_u16(rom, off + 2,  pack.cards_per_pack & 0xFFFF)
-        self._write_u16(rom, off + 4,  pack.card_amount & 0xFFFF)
-        self._write_u16(rom, off + 6,  pack.unk0 & 0xFFFF)
-        self._write_u16(rom, off + 8,  pack.unk1 & 0xFFFF)
-        self._write_u16(rom, off + 10, pack.padding & 0xFFFF)
+        PACK_HEADER_STRUCT.pack_into(
+            rom, off,
+            pack.cost & 0xFFFF,
+            pack.cards_per_pack & 0xFFFF,
+            pack.card_amount & 0xFFFF,
+            pack.unk0 & 0xFFFF,
+            pack.unk1 & 0xFFFF,
+            pack.padding & 0xFFFF,
+        )
 
         contents_blob = self._encode_pack_contents(pack)
         new_size = len(contents_blob)
@@ -1867,14 +2382,20 @@ class RomEditorApp(tk.Tk):
         if not path:
             return
         try:
+            # Read straight into the editable buffer rather than into bytes
+            # that then get copied
             with open(path, "rb") as f:
-                data = f.read()
+                data = bytearray(os.fstat(f.fileno()).st_size)
+                del data[f.readinto(data):]
         except Exception as e:
             messagebox.showerror("Error", f"Failed to open ROM:\n{e}")
             return
 
-        self.rom_data = bytearray(data)
+        self.rom_data = data
         self.rom_path = path
+        self._clear_rom_caches()
+        self._card_list_stale = True
+        self._card_id_choices_stale = True
 
         try:
             self.cards = self._parse_cards()
@@ -1883,7 +2404,15 @@ class RomEditorApp(tk.Tk):
             messagebox.showerror("Error", f"Failed to parse ROM:\n{e}")
             self.rom_data = None
             self.cards = []
+            self.card_names = []
+            self.card_names_lc = []
+            self.card_name_trigrams = {}
+            self.card_labels = []
             return
+        self.card_names = [card.name for card in self.cards]
+        self.card_names_lc = [name.lower() for name in self.card_names]
+        self.card_name_trigrams = self._build_trigram_index(self.card_names_lc)
+        self.card_labels = [self._card_label(i, name) for i, name in enumerate(self.card_names)]
 
         self._update_card_id_choices()
         self._build_deck_card_choices()
@@ -1938,24 +2467,25 @@ class RomEditorApp(tk.Tk):
         if addr < 0 or addr >= len(data):
             raise ValueError(f"String address {hex(addr)} out of range.")
         end_limit = min(TEXT_LIMIT, len(data))
-        out = []
-        pos = addr
-        while pos < end_limit:
-            b = data[pos]
-            if b == 0:
-                break
-            out.append(b)
-            pos += 1
-        s = bytes(out).decode("ascii", errors="replace")
-        return s, len(out)
+        # find() scans for the terminator in C; unterminated strings run
+        # to end_limit (and an address past it reads as empty)
+        end = data.find(0, addr, end_limit)
+        if end < 0:
+            end = max(addr, end_limit)
+        s = data[addr:end].decode("ascii", errors="replace")
+        return s, end - addr
 
     @staticmethod
     def _read_u32(data, offset):
+        # unpack_from reads in place; only a read running off either end of
+        # the buffer takes the slice path (missing bytes read as 0)
+        if 0 <= offset <= len(data) - 4:
+            return U32_STRUCT.unpack_from(data, offset)[0]
         return int.from_bytes(data[offset:offset + 4], "little")
 
     @staticmethod
     def _write_u32(data, offset, value):
-        data[offset:offset + 4] = int(value & 0xFFFFFFFF).to_bytes(4, "little")
+        U32_STRUCT.pack_into(data, offset, int(value) & 0xFFFFFFFF)
 
     def _find_free_space_ff(self, rom_data, size, alignment=4):
         """
@@ -1987,11 +2517,14 @@ class RomEditorApp(tk.Tk):
 
     @staticmethod
     def _read_u16(data, offset):
+        # Same in-place read as _read_u32
+        if 0 <= offset <= len(data) - 2:
+            return U16_STRUCT.unpack_from(data, offset)[0]
         return int.from_bytes(data[offset:offset + 2], "little")
 
     @staticmethod
     def _write_u16(data, offset, value):
-        data[offset:offset + 2] = int(value & 0xFFFF).to_bytes(2, "little")
+        U16_STRUCT.pack_into(data, offset, int(value) & 0xFFFF)
 
     def _read_card_id_index_from_table(self, data, konami_id):
         """
@@ -2009,60 +2542,66 @@ class RomEditorApp(tk.Tk):
     def _parse_cards(self):
         cards = []
         data = self.rom_data
+        # Table reads below slice this view instead of the bytearray, so
+        # they don't allocate a copy per read (strings still need the
+        # bytearray for find/decode)
+        mv = memoryview(data)
+
+        # The pointer and stats tables are each decoded with one struct call
+        # instead of a pair of reads per pointer and eleven per stats row.
+        stats_end = CARD_STATS_BASE + NUM_CARDS * CARD_STATS_SIZE
+        if stats_end > len(data):
+            first_bad = max(0, (len(data) - CARD_STATS_BASE) // CARD_STATS_SIZE)
+            raise ValueError(f"Primary stats for card {first_bad} out of range.")
+        name_rels = struct.unpack_from(f"<{NUM_CARDS}I", data, CARD_NAME_PTR_BASE)
+        desc_rels = struct.unpack_from(f"<{NUM_CARDS}I", data, CARD_DESC_PTR_BASE)
+        stats_rows = CARD_STATS_STRUCT.iter_unpack(mv[CARD_STATS_BASE:stats_end])
+
+        # Decode every distinct string once, walking the text block in
+        # address order; cards sharing a text (e.g. a blank description)
+        # point at the same bytes.
+        text_addrs = sorted({TEXT_BASE + rel for rel in name_rels + desc_rels})
+        texts = {addr: self._read_c_string(data, addr) for addr in text_addrs}
+
+        # Passwords (BCD) and prices, indexed by card name index. The
+        # password table sits below the pointer tables, so it is in range
+        # whenever they are; price entries past the end of the ROM read as 0.
+        passwords = _decode_bcd_passwords(
+            bytes(mv[PASSWORD_TABLE_BASE:PASSWORD_TABLE_BASE + NUM_CARDS * 4])
+        )
+        price_count = min(NUM_CARDS, max(0, (len(data) - PRICE_TABLE_BASE) // PRICE_ENTRY_SIZE))
+        prices = struct.unpack_from(f"<{price_count}I", data, PRICE_TABLE_BASE) if price_count else ()
+        prices += (0,) * (NUM_CARDS - price_count)
+
+        # Card ID table, read once for both passes: slot (Konami ID - 4007)
+        # holds the card name index. It sits below the pointer tables, so it
+        # is in range whenever they are. IDs outside the secondary range fall
+        # back to the bounds-checked single read.
+        card_id_table = struct.unpack_from(f"<{SECOND_STATS_COUNT}H", mv, CARD_ID_TABLE_BASE)
+
+        def card_id_index_for(konami_id):
+            pos = konami_id - KONAMI_ID_BASE
+            if 0 <= pos < SECOND_STATS_COUNT:
+                return card_id_table[pos]
+            return self._read_card_id_index_from_table(mv, konami_id)
 
         # First pass: names, descriptions, PRIMARY stats
-        for i in range(NUM_CARDS):
+        for i, name_rel, desc_rel, stats, password, price in zip(
+            range(NUM_CARDS), name_rels, desc_rels, stats_rows, passwords, prices
+        ):
             name_ptr_off = CARD_NAME_PTR_BASE + i * 4
-            name_rel = int.from_bytes(data[name_ptr_off:name_ptr_off + 4], "little")
             name_addr = TEXT_BASE + name_rel
-            name_str, name_len = self._read_c_string(data, name_addr)
+            name_str, name_len = texts[name_addr]
 
             desc_ptr_off = CARD_DESC_PTR_BASE + i * 4
-            desc_rel = int.from_bytes(data[desc_ptr_off:desc_ptr_off + 4], "little")
             desc_addr = TEXT_BASE + desc_rel
-            desc_str, desc_len = self._read_c_string(data, desc_addr)
-
-            stats_off = CARD_STATS_BASE + i * CARD_STATS_SIZE
-            if stats_off + CARD_STATS_SIZE > len(data):
-                raise ValueError(f"Primary stats for card {i} out of range.")
-
-            konami_id = self._read_u16(data, stats_off + 0x0)
-            artwork_id = self._read_u16(data, stats_off + 0x2)
-            edited_flag = self._read_u16(data, stats_off + 0x4)
-            atk = self._read_u16(data, stats_off + 0x6)
-            deff = self._read_u16(data, stats_off + 0x8)
-            level = self._read_u16(data, stats_off + 0xA)
-            race = self._read_u16(data, stats_off + 0xC)
-            attribute = self._read_u16(data, stats_off + 0xE)
-            type_ = self._read_u16(data, stats_off + 0x10)
-            st_race = self._read_u16(data, stats_off + 0x12)
-            padding = self._read_u16(data, stats_off + 0x14)
-
-            card_id_index = self._read_card_id_index_from_table(data, konami_id)
-
-            # --- NEW: password + price (4 bytes each, indexed by card name index) ---
-            pw_off = PASSWORD_TABLE_BASE + i * 4
-            pw_raw = data[pw_off:pw_off + 4]
-
-            # Reverse byte order
-            pw_raw = pw_raw[::-1]
-
-            digits = []
-            for b in pw_raw:
-                hi = (b >> 4) & 0xF
-                lo = b & 0xF
-                digits.append(str(hi if hi <= 9 else 0))
-                digits.append(str(lo if lo <= 9 else 0))
-
-            password = int("".join(digits))
-
-            price_off = PRICE_TABLE_BASE    + i * PRICE_ENTRY_SIZE
-
-            if price_off + 4 <= len(data):
-                price = int.from_bytes(data[price_off:price_off + 4], "little")
-            else:
-                price = 0
-            
+            desc_str, desc_len = texts[desc_addr]
+
+            (konami_id, artwork_id, edited_flag, atk, deff, level,
+             race, attribute, type_, st_race, padding) = stats
+
+            card_id_index = card_id_index_for(konami_id)
+
             gfx_off = CARD_GFX_BASE + card_id_index * CARD_GFX_SIZE
             pal_off = CARD_PAL_BASE + card_id_index * CARD_PAL_SIZE
             if gfx_off + CARD_GFX_SIZE > len(self.rom_data) or pal_off + CARD_PAL_SIZE > len(self.rom_data):
@@ -2098,26 +2637,19 @@ class RomEditorApp(tk.Tk):
 
         # Second pass: SECONDARY stats (2648 entries)
         # Map by second-table index -> card ID table slot -> card name index.
-        for sec_idx in range(SECOND_STATS_COUNT):
-            stats2_off = SECOND_CARD_STATS_BASE + sec_idx * SECOND_CARD_STATS_SIZE
-            if stats2_off + SECOND_CARD_STATS_SIZE > len(data):
-                break
-
-            konami2 = self._read_u16(data, stats2_off + 0x0)
-            artwork2 = self._read_u16(data, stats2_off + 0x2)
-            edited_flag2 = self._read_u16(data, stats2_off + 0x4)
-            atk2 = self._read_u16(data, stats2_off + 0x6)
-            deff2 = self._read_u16(data, stats2_off + 0x8)
-            level2 = self._read_u16(data, stats2_off + 0xA)
-            race2 = self._read_u16(data, stats2_off + 0xC)
-            attribute2 = self._read_u16(data, stats2_off + 0xE)
-            type2 = self._read_u16(data, stats2_off + 0x10)
-            st_race2 = self._read_u16(data, stats2_off + 0x12)
-            padding2 = self._read_u16(data, stats2_off + 0x14)
-
-            # Use second table index as "card ID index - 4007".
-            # So slot sec_idx in the card ID table gives us the card name index.
-            card_name_index = self._read_u16(data, CARD_ID_TABLE_BASE + sec_idx * 2)
+        # Rows past the end of the ROM are dropped, as before.
+        sec_count = min(
+            SECOND_STATS_COUNT,
+            max(0, (len(data) - SECOND_CARD_STATS_BASE) // SECOND_CARD_STATS_SIZE),
+        )
+        stats2_rows = CARD_STATS_STRUCT.iter_unpack(
+            mv[SECOND_CARD_STATS_BASE:SECOND_CARD_STATS_BASE + sec_count * SECOND_CARD_STATS_SIZE]
+        )
+        # Use second table index as "card ID index - 4007".
+        # So slot sec_idx in the card ID table gives us the card name index.
+        for sec_idx, stats2, card_name_index in zip(range(sec_count), stats2_rows, card_id_table):
+            (konami2, artwork2, edited_flag2, atk2, deff2, level2,
+             race2, attribute2, type2, st_race2, padding2) = stats2
 
             if card_name_index == 0xFFFF:
                 # "None" slot – doesn't map to an internal card name index.
@@ -2134,7 +2666,7 @@ class RomEditorApp(tk.Tk):
             card.konami2 = konami2
             # Derive the display card ID index from Konami2 at parse-time,
             # so the secondary Card ID label is correct immediately.
-            konami_based_idx = self._read_card_id_index_from_table(data, konami2)
+            konami_based_idx = card_id_index_for(konami2)
             card.card_id_index2 = konami_based_idx
             card.artwork2 = artwork2
             card.edited_flag2 = edited_flag2
@@ -2186,6 +2718,61 @@ class RomEditorApp(tk.Tk):
         self.konami_to_deck_choice_index = {
             kid: idx for idx, kid in enumerate(self.deck_card_choice_konami)
         }
+        # Konami IDs are 16-bit, so a flat table (-1 = not a ROM card)
+        # answers label lookups without hashing
+        arr = array("i", [-1]) * 0x10000
+        for kid, idx in self.konami_to_deck_choice_index.items():
+            arr[kid] = idx
+        self.konami_to_choice_arr = arr
+        self.deck_card_choices_tuple = tuple(self.deck_card_choices)
+        self.deck_card_choices_lc = [lbl.lower() for lbl in self.deck_card_choices]
+        # Card names are normally plain ASCII; bytes substring tests skip
+        # str's width handling. Anything non-ASCII keeps the str path so
+        # matches are never lost to encoding.
+        if all(lbl.isascii() for lbl in self.deck_card_choices_lc):
+            self.deck_card_choices_lc_b = [lbl.encode("ascii") for lbl in self.deck_card_choices_lc]
+        else:
+            self.deck_card_choices_lc_b = None
+        self.deck_choice_trigrams = self._build_trigram_index(self.deck_card_choices_lc)
+
+    @staticmethod
+    def _build_trigram_index(labels_lc):
+        """
+        Inverted index for substring filtering: every 3-character slice of
+        each (lowercased) label -> set of label indices containing it.
+        """
+        index = {}
+        for i, lbl in enumerate(labels_lc):
+            for tri in {lbl[j:j + 3] for j in range(len(lbl) - 2)}:
+                index.setdefault(tri, set()).add(i)
+        return index
+
+    def _filter_corpus(self, pattern):
+        """
+        (pattern, labels) pair for substring filtering of deck_card_choices:
+        the ASCII bytes corpus when both sides allow it, else the str one.
+        """
+        if self.deck_card_choices_lc_b is not None and pattern.isascii():
+            return pattern.encode("ascii"), self.deck_card_choices_lc_b
+        return pattern, self.deck_card_choices_lc
+
+    @staticmethod
+    def _trigram_candidates(index, pattern):
+        """
+        Sorted label indices that contain every trigram of pattern, i.e. a
+        superset of the labels containing pattern. Returns None when the
+        pattern is too short to use the index.
+        """
+        if len(pattern) < 3:
+            return None
+        postings = []
+        for tri in {pattern[j:j + 3] for j in range(len(pattern) - 2)}:
+            posting = index.get(tri)
+            if not posting:
+                return []
+            postings.append(posting)
+        postings.sort(key=len)
+        return sorted(postings[0].intersection(*postings[1:]))
 
     # =========================
     # FREE SPACE / WRITE
@@ -2197,22 +2784,24 @@ class RomEditorApp(tk.Tk):
         if size <= 0:
             return None
 
-        run_start = None
-        run_length = 0
-        for addr in range(start, end):
-            if rom_data[addr] == 0:
-                if run_start is None:
-                    run_start = addr
-                    run_length = 1
-                else:
-                    run_length += 1
-                if run_length >= size:
-                    # Place the pointer at run_start + 1 per your request
-                    return run_start + 1
-            else:
-                run_start = None
-                run_length = 0
-        return None
+        # The block goes at run_start + 1 (leaving a zero after whatever
+        # precedes the run), so the run needs size + 1 zero bytes. Asking
+        # for only size zeros, as this used to, let a gap of exactly size
+        # bytes be picked; the block's terminator then landed on the byte
+        # after the gap and cut off the string stored there. A ROM whose
+        # only room left is such a gap now fails to relocate instead.
+        # The first fitting run is the first match of that many zeros;
+        # during a save the run index answers that without scanning,
+        # otherwise find() scans for it in C.
+        runs = self._free_runs
+        if runs is not None and runs.buf is rom_data:
+            run_start = runs.first_fit(size + 1)
+        else:
+            run_start = rom_data.find(bytes(size + 1), start, end)
+        if run_start < 0:
+            return None
+        # Place the pointer at run_start + 1 per your request
+        return run_start + 1
 
     def _write_string_and_update_pointer(self, rom_data, card, is_name):
         if is_name:
@@ -2229,7 +2818,16 @@ class RomEditorApp(tk.Tk):
         encoded = text.encode("ascii", errors="replace")
         needed = len(encoded) + 1  # include 0 terminator
 
-        if needed <= slot_size and 0 <= orig_addr < len(rom_data):
+        in_rom = 0 <= orig_addr < len(rom_data)
+        if (in_rom and needed == slot_size
+                and rom_data[orig_addr:orig_addr + needed] == encoded + b"\x00"):
+            return  # this string is unchanged (the card's other one was edited)
+
+        # Another card may point at the same bytes (_parse_cards dedups
+        # strings) or into the slot; such a slot is neither rewritten nor
+        # freed, the edited string moves out instead
+        shared = self._text_slot_shared(orig_addr)
+        if needed <= slot_size and in_rom and not shared:
             write_addr = orig_addr
         else:
             write_addr = self._find_free_space(rom_data, needed)
@@ -2238,58 +2836,130 @@ class RomEditorApp(tk.Tk):
                     f"Not enough free space for {'name' if is_name else 'description'} "
                     f"of card {card.index} (need {needed} bytes)."
                 )
-            # Zero-out the new block
-            for i in range(write_addr, write_addr + needed):
-                if i < len(rom_data):
-                    rom_data[i] = 0
-            # Zero-out the old slot
-            if 0 <= orig_addr < len(rom_data):
-                for o in range(orig_addr, min(orig_addr + slot_size, len(rom_data))):
-                    rom_data[o] = 0
-
-            # Update card slot info & pointer
-            if is_name:
-                card.name_addr = write_addr
-                card.name_slot_size = needed
-            else:
-                card.desc_addr = write_addr
-                card.desc_slot_size = needed
-
+            # Zero-out the old slot, unless other cards still use it
+            if shared:
+                self._text_refs[orig_addr] -= 1
+            elif in_rom:
+                self._zero_fill(rom_data, orig_addr, orig_addr + slot_size)
+                self._text_written(rom_data, orig_addr, orig_addr + slot_size)
+
+            # Only this copy's pointer moves. The card keeps the loaded
+            # ROM's address and slot size, since every save starts from a
+            # fresh copy of the loaded ROM and relocates again from there.
             rel = write_addr - TEXT_BASE
             if rel < 0 or rel > 0xFFFFFFFF:
                 raise RuntimeError("Relative pointer out of 32-bit range.")
-            rom_data[ptr_off:ptr_off + 4] = rel.to_bytes(4, "little")
+            U32_STRUCT.pack_into(rom_data, ptr_off, rel)
 
         if write_addr < 0 or write_addr + needed > len(rom_data):
             raise RuntimeError("Write address out of bounds.")
 
-        rom_data[write_addr:write_addr + len(encoded)] = encoded
-        if write_addr + len(encoded) < len(rom_data):
-            rom_data[write_addr + len(encoded)] = 0
-        else:
-            raise RuntimeError("No space to write terminator byte.")
-
-        # Clean remaining bytes in slot if shorter
+        # String, terminator and (in place) the rest of the old slot in one store
+        span = needed
         if write_addr == orig_addr and needed < slot_size:
-            for o in range(write_addr + needed, write_addr + slot_size):
-                if o < len(rom_data):
-                    rom_data[o] = 0
-
-    def _write_stats_primary(self, rom_data, card):
-        off = CARD_STATS_BASE + card.index * CARD_STATS_SIZE
-        if off + CARD_STATS_SIZE > len(rom_data):
-            raise RuntimeError(f"Primary stats for card {card.index} out of range.")
-        self._write_u16(rom_data, off + 0x0, card.konami_id)
-        self._write_u16(rom_data, off + 0x2, card.artwork_id)
-        self._write_u16(rom_data, off + 0x4, card.edited_flag)
-        self._write_u16(rom_data, off + 0x6, card.atk)
-        self._write_u16(rom_data, off + 0x8, card.deff)
-        self._write_u16(rom_data, off + 0xA, card.level)
-        self._write_u16(rom_data, off + 0xC, card.race)
-        self._write_u16(rom_data, off + 0xE, card.attribute)
-        self._write_u16(rom_data, off + 0x10, card.type_)
-        self._write_u16(rom_data, off + 0x12, card.st_race)
-        self._write_u16(rom_data, off + 0x14, card.padding)
+            span = min(slot_size, len(rom_data) - write_addr)
+        rom_data[write_addr:write_addr + span] = encoded.ljust(span, b"\x00")
+        self._text_written(rom_data, write_addr, write_addr + span)
+
+    def _write_card_texts(self, rom_copy):
+        """
+        Write the edited names and descriptions into rom_copy, which starts
+        from the loaded ROM, where untouched strings already sit behind
+        their pointers. Strings that still fit their own (unshared) slot go
+        first, freeing any slack; the rest are relocated largest first so
+        they get the big runs and the small ones fill the gaps left behind.
+        """
+        # Free text space is indexed once per loaded ROM and copied for each
+        # save; the string writer keeps the copy current (see _FreeRunIndex).
+        # Nothing writes to the loaded ROM's text block, and every save
+        # starts from a fresh copy of the loaded ROM.
+        if self._rom_free_runs is None or self._rom_free_runs.buf is not self.rom_data:
+            self._rom_free_runs = _FreeRunIndex(
+                self.rom_data, TEXT_BASE, min(TEXT_LIMIT, len(self.rom_data)))
+        self._free_runs = self._rom_free_runs.copy_for(rom_copy)
+        self._count_text_refs()
+        try:
+            relocate = []
+            rom_len = len(rom_copy)
+            for card in self.cards:
+                if not card.text_dirty:
+                    continue
+                # ascii/"replace" encodes one byte per character
+                for is_name, text, addr, slot_size in (
+                    (True, card.name, card.name_addr, card.name_slot_size),
+                    (False, card.desc, card.desc_addr, card.desc_slot_size),
+                ):
+                    needed = len(text) + 1
+                    if needed <= slot_size and 0 <= addr < rom_len and not self._text_slot_shared(addr):
+                        self._write_string_and_update_pointer(rom_copy, card, is_name)
+                    else:
+                        relocate.append((needed, card, is_name))
+            relocate.sort(key=itemgetter(0), reverse=True)
+            for _needed, card, is_name in relocate:
+                self._write_string_and_update_pointer(rom_copy, card, is_name)
+        finally:
+            self._free_runs = None
+            self._text_refs = self._text_pinned = None
+
+    def _text_slot_shared(self, addr):
+        """True if, in the save in progress, more than one string uses the slot at addr."""
+        refs = self._text_refs
+        if refs is None:
+            return False
+        return refs[addr] > 1 or addr in self._text_pinned
+
+    def _count_text_refs(self):
+        """
+        Set _text_refs / _text_pinned for a save from every card's loaded
+        name and description address.
+        """
+        refs = Counter()
+        slots = {}
+        for card in self.cards:
+            refs[card.name_addr] += 1
+            refs[card.desc_addr] += 1
+            slots[card.name_addr] = card.name_slot_size
+            slots[card.desc_addr] = card.desc_slot_size
+        # A pointer into the middle of a slot shares that string's tail, so
+        # neither string may be rewritten in place or freed
+        addrs = sorted(slots)
+        pinned = set()
+        for addr, next_addr in zip(addrs, islice(addrs, 1, None)):
+            if next_addr < addr + slots[addr]:
+                pinned.add(addr)
+                pinned.add(next_addr)
+        self._text_refs, self._text_pinned = refs, pinned
+
+    def _text_written(self, rom_data, lo, hi):
+        """Keep the save's free-run index in step with a write to rom_data[lo:hi]."""
+        runs = self._free_runs
+        if runs is not None and runs.buf is rom_data:
+            runs.touch(lo, hi)
+
+    @staticmethod
+    def _zero_fill(rom_data, lo, hi):
+        """Zero rom_data[lo:hi] (clipped to the ROM) with one slice assignment."""
+        hi = min(hi, len(rom_data))
+        if lo < hi:
+            rom_data[lo:hi] = bytes(hi - lo)
+
+    def _write_stats_primary(self, rom_data):
+        """
+        Write every card's primary stats row. self.cards is in card index
+        order and the rows are contiguous, so the whole table is packed
+        with one struct call and copied into the ROM in one slice.
+        """
+        end = CARD_STATS_BASE + len(self.cards) * CARD_STATS_SIZE
+        if end > len(rom_data):
+            first_bad = max(0, (len(rom_data) - CARD_STATS_BASE) // CARD_STATS_SIZE)
+            raise RuntimeError(f"Primary stats for card {first_bad} out of range.")
+        # 0x0 konami, 0x2 artwork, 0x4 edited flag, 0x6 atk, 0x8 def,
+        # 0xA level, 0xC race, 0xE attribute, 0x10 type, 0x12 st race,
+        # 0x14 padding
+        fields = chain.from_iterable(map(_CARD_STATS_PRIMARY_FIELDS, self.cards))
+        rom_data[CARD_STATS_BASE:end] = struct.pack(
+            f"<{len(self.cards) * 11}H", *[int(v) & 0xFFFF for v in fields]
+        )
 
     def _write_stats_secondary(self, rom_data, card):
         if card.second_stats_index < 0:
@@ -2297,17 +2967,15 @@ class RomEditorApp(tk.Tk):
         off = SECOND_CARD_STATS_BASE + card.second_stats_index * SECOND_CARD_STATS_SIZE
         if off + SECOND_CARD_STATS_SIZE > len(rom_data):
             return
-        self._write_u16(rom_data, off + 0x0, card.konami2)
-        self._write_u16(rom_data, off + 0x2, card.artwork2)
-        self._write_u16(rom_data, off + 0x4, card.edited_flag2)
-        self._write_u16(rom_data, off + 0x6, card.atk2)
-        self._write_u16(rom_data, off + 0x8, card.deff2)
-        self._write_u16(rom_data, off + 0xA, card.level2)
-        self._write_u16(rom_data, off + 0xC, card.race2)
-        self._write_u16(rom_data, off + 0xE, card.attribute2)
-        self._write_u16(rom_data, off + 0x10, card.type2)
-        self._write_u16(rom_data, off + 0x12, card.st_race2)
-        self._write_u16(rom_data, off + 0x14, card.padding2)
+        # Same layout as the primary stats entry
+        CARD_STATS_STRUCT.pack_into(
+            rom_data, off,
+            *(int(v) & 0xFFFF for v in (
+                card.konami2, card.artwork2, card.edited_flag2,
+                card.atk2, card.deff2, card.level2, card.race2,
+                card.attribute2, card.type2, card.st_race2, card.padding2,
+            ))
+        )
 
     def _write_card_id_entry(self, rom_data, konami_id, card_id_index):
         """
@@ -2323,13 +2991,15 @@ class RomEditorApp(tk.Tk):
         self._write_u16(rom_data, offset, card_id_index)
 
     def _apply_all_changes_to_rom(self, rom_copy):
+        # Fixed-stride tables are written whole
+        self._write_stats_primary(rom_copy)
+        self._write_passwords_and_prices(rom_copy)
+
+        self._write_card_texts(rom_copy)
+
         for card in self.cards:
-            self._write_string_and_update_pointer(rom_copy, card, is_name=True)
-            self._write_string_and_update_pointer(rom_copy, card, is_name=False)
-            self._write_stats_primary(rom_copy, card)
             self._write_stats_secondary(rom_copy, card)
             self._write_card_id_entry(rom_copy, card.konami_id, card.card_id_index)
-            self._write_password_and_price(rom_copy, card)
 
         # Make sure the currently-selected artwork row is flushed from the UI
         self._apply_artwork_ui_to_entry()
@@ -2345,19 +3015,20 @@ class RomEditorApp(tk.Tk):
     # =========================
 
     def _card_id_display_for_index(self, idx):
-        if 0 <= idx < len(self.cards):
-            name = self.cards[idx].name.replace("\n", " ")
-            if len(name) > 30:
-                name = name[:30] + "..."
-            return f"{idx:04d}: {name}"
+        if 0 <= idx < len(self.card_labels):
+            return self.card_labels[idx]
         return f"{idx:04d}"
 
     def _update_card_id_choices(self):
-        self.card_id_choices = [self._card_id_display_for_index(i) for i in range(len(self.cards))]
+        # The labels are the card list's (kept current by _set_card_name),
+        # so the combos only need new values after a load or a rename
+        if not self._card_id_choices_stale:
+            return
+        self._card_id_choices_stale = False
+        self.card_id_choices = tuple(self.card_labels)
         self.card_id_main_combo["values"] = self.card_id_choices
         self.card_id_sec_combo["values"] = self.card_id_choices
-        if hasattr(self, "artwork_card_combo"):
-            self.artwork_card_combo["values"] = self.card_id_choices
+        # Both artwork dropdowns pick from the artwork names
         self.artwork_unk_combo["values"] = self.artwork_names
         self.artwork_card_combo["values"] = self.artwork_names
 
@@ -2406,42 +3077,61 @@ class RomEditorApp(tk.Tk):
         entry = self.artworks[idx]
 
         # -------- FIRST HALFWORD --------
-        unk_name = self.artwork_unk_var.get()
-        if unk_name in self.artwork_names:
-            entry.unk_halfword = self.artwork_names.index(unk_name)
+        unk_idx = self._artwork_names_index.get(self.artwork_unk_var.get())
+        if unk_idx is not None:
+            entry.unk_halfword = unk_idx
 
         # -------- SECOND HALFWORD --------
-        card_name = self.artwork_card_var.get()
-        if card_name in self.artwork_names:
-            entry.card_name_index = self.artwork_names.index(card_name)
+        card_idx = self._artwork_names_index.get(self.artwork_card_var.get())
+        if card_idx is not None:
+            entry.card_name_index = card_idx
+            self._artwork_gfx_index[idx] = card_idx
 
     def _set_card_id_ui(self, var_obj, index_val, konami_id=None):
         """
         index_val == 0xFFFF -> use YGOPRODeck (None) style label.
         Otherwise -> "nnnn: Name".
         """
+        self._card_id_ui_index[str(var_obj)] = index_val
         if index_val == 0xFFFF:
-            if konami_id is not None and konami_id in self.konami_name_map:
-                base_name = self.konami_name_map[konami_id]
-                label = f"{base_name} (None)"
-            elif konami_id is not None:
-                label = f"Konami {konami_id} (None)"
-            else:
-                label = "None"
-            var_obj.set(label)
+            var_obj.set(self._konami_none_label(konami_id))
         else:
             var_obj.set(self._card_id_display_for_index(index_val))
 
-    @staticmethod
-    def _get_card_id_index_from_ui(var_obj):
+    def _konami_none_label(self, konami_id):
+        """Label for a card with no name index, memoized per Konami ID."""
+        label = self._konami_none_label_cache.get(konami_id)
+        if label is None:
+            if konami_id is None:
+                label = "None"
+            elif konami_id in self.konami_name_map:
+                label = f"{self.konami_name_map[konami_id]} (None)"
+            else:
+                label = f"Konami {konami_id} (None)"
+            self._konami_none_label_cache[konami_id] = label
+        return label
+
+    def _on_card_id_selected(self, combo, var_obj):
+        """Remember the index picked from a Card ID dropdown (values are in index order)."""
+        row = combo.current()
+        if row >= 0:
+            self._card_id_ui_index[str(var_obj)] = row
+        else:
+            self._card_id_ui_index.pop(str(var_obj), None)
+
+    def _get_card_id_index_from_ui(self, var_obj):
+        cached = self._card_id_ui_index.get(str(var_obj))
+        if cached is not None:
+            return cached
+
+        # Not set through _set_card_id_ui / the dropdown: parse the label
         val = var_obj.get()
         if not val:
             return 0
         if val.endswith("(None)"):
             return 0xFFFF
-        part = val.split(":", 1)[0].strip()
         try:
-            return int(part)
+            return int(val.partition(":")[0])
         except ValueError:
             return 0
 
@@ -2449,22 +3139,45 @@ class RomEditorApp(tk.Tk):
     # LIST & EDITOR UI
     # =========================
 
+    @staticmethod
+    def _card_label(idx, name):
+        """List label for a card: '0000: Name', newlines flattened, cut at 30 chars."""
+        name = name.replace("\n", " ")
+        if len(name) > 30:
+            name = name[:30] + "..."
+        return f"{idx:04d}: {name}"
+
     def _populate_card_list(self, filter_text=""):
         filter_text = filter_text.lower()
+        if filter_text:
+            names_lc = self.card_names_lc
+            if (self._card_filter and filter_text.startswith(self._card_filter)
+                    and not self._card_list_stale):
+                # Typing narrows the filter: only the visible rows can still match.
+                new_filtered = [i for i in self.filtered_indices if filter_text in names_lc[i]]
+            else:
+                # The trigram index rules out most names up front
+                candidates = self._trigram_candidates(self.card_name_trigrams, filter_text)
+                if candidates is None:
+                    candidates = range(len(names_lc))
+                new_filtered = [i for i in candidates if filter_text in names_lc[i]]
+        else:
+            new_filtered = list(range(len(self.cards)))
+
+        self._card_filter = filter_text
+        # Same rows with the same labels: nothing visible would change.
+        if new_filtered == self.filtered_indices and not self._card_list_stale:
+            return
+
         self.card_listbox.delete(0, tk.END)
-        self.filtered_indices = []
-        for i, card in enumerate(self.cards):
-            if filter_text and filter_text not in card.name.lower():
-                continue
-            self.filtered_indices.append(i)
-        for idx in self.filtered_indices:
-            card = self.cards[idx]
-            display = card.name.replace("\n", " ")
-            if len(display) > 30:
-                display = display[:30] + "..."
-            self.card_listbox.insert(tk.END, f"{card.index:04d}: {display}")
-        if self.current_index is not None and self.current_index in self.filtered_indices:
-            row = self.filtered_indices.index(self.current_index)
+        self.filtered_indices = new_filtered
+        self._row_of_card = {idx: row for row, idx in enumerate(new_filtered)}
+        self._card_list_stale = False
+        # One insert call for all rows instead of one Tcl round trip each
+        labels = self.card_labels
+        self.card_listbox.insert(tk.END, *[labels[idx] for idx in self.filtered_indices])
+        row = self._row_of_card.get(self.current_index)
+        if row is not None:
             self.card_listbox.selection_set(row)
             self.card_listbox.see(row)
 
@@ -2536,25 +3249,17 @@ class RomEditorApp(tk.Tk):
         set_combo(self.st_race_sec_combo, card.st_race2, self.st_races_list, self.st_race_sec_var)
 
         # Listbox selection
-        if self.filtered_indices:
-            try:
-                row = self.filtered_indices.index(index)
-            except ValueError:
-                self.card_listbox.selection_clear(0, tk.END)
-            else:
-                self.card_listbox.selection_clear(0, tk.END)
-                self.card_listbox.selection_set(row)
-                self.card_listbox.see(row)
-        else:
-            self.card_listbox.selection_clear(0, tk.END)
-            if index < self.card_listbox.size():
-                self.card_listbox.selection_set(index)
-                self.card_listbox.see(index)
+        self.card_listbox.selection_clear(0, tk.END)
+        row = self._row_of_card.get(index)
+        if row is not None:
+            self.card_listbox.selection_set(row)
+            self.card_listbox.see(row)
 
         # --- Misc Info: password + price ---
         # Show password as 8-digit zero-padded decimal (standard YGO style)
         self.password_var.set(f"{card.password:08d}")
         self.price_var.set(card.price)
+        self._editor_snapshot = self._editor_state()
         
         # --- NEW: sync Artwork tab to this card's Artwork # ---
         if self.artworks:
@@ -2580,73 +3285,144 @@ class RomEditorApp(tk.Tk):
         idx = self.filtered_indices[row]
         self._load_card_into_editor(idx)
 
-    def _write_password_and_price(self, rom_data, card):
-        # ----- Password: 8-digit decimal → 4 BCD bytes -----
-        pw_off = PASSWORD_TABLE_BASE + card.index * PASSWORD_ENTRY_SIZE
-        pw_text = f"{card.password:08d}"
-        pw_bytes = bytearray()
-
-        # Build four bytes from the editor string (forward order)
-        for i in range(0, 8, 2):
-            hi = int(pw_text[i])
-            lo = int(pw_text[i + 1])
-            pw_bytes.append((hi << 4) | lo)
-
-        # Reverse *before writing to ROM*
-        pw_bytes = pw_bytes[::-1]
+    def _write_passwords_and_prices(self, rom_data):
+        """
+        Write the password and price tables. Both are contiguous and in card
+        index order, so each is packed whole and stored with one slice.
+        """
+        cards = self.cards
 
-        rom_data[pw_off:pw_off + 4] = pw_bytes
+        # ----- Password: 8-digit decimal → 4 BCD bytes -----
+        # Reading the decimal digits as hex gives the BCD nibbles in forward
+        # order; the ROM stores those four bytes reversed, i.e. little-endian.
+        pw_end = PASSWORD_TABLE_BASE + len(cards) * PASSWORD_ENTRY_SIZE
+        if pw_end > len(rom_data):
+            raise RuntimeError("Password table out of range.")
+        rom_data[PASSWORD_TABLE_BASE:pw_end] = struct.pack(
+            f"<{len(cards)}I", *[int(f"{card.password:08d}"[:8], 16) for card in cards]
+        )
 
         # ----- Price (still plain little-endian 32-bit) -----
-        price_off = PRICE_TABLE_BASE + card.index * PRICE_ENTRY_SIZE
-        if price_off + 4 <= len(rom_data):
-            rom_data[price_off:price_off + 4] = int(card.price & 0xFFFFFFFF).to_bytes(4, "little")
-
-        # Price
-        price_off = PRICE_TABLE_BASE + card.index * PRICE_ENTRY_SIZE
-        if price_off + 4 <= len(rom_data):
-            rom_data[price_off:price_off + 4] = int(card.price & 0xFFFFFFFF).to_bytes(4, "little")
+        # Entries past the end of the ROM are dropped
+        count = min(len(cards), max(0, (len(rom_data) - PRICE_TABLE_BASE) // PRICE_ENTRY_SIZE))
+        if count:
+            rom_data[PRICE_TABLE_BASE:PRICE_TABLE_BASE + count * PRICE_ENTRY_SIZE] = struct.pack(
+                f"<{count}I", *[card.price & 0xFFFFFFFF for card in islice(cards, count)]
+            )
 
     def _write_artwork_table(self, rom_data):
-        for entry in self.artworks:
-            off = ARTWORK_TABLE_BASE + entry.index * 4
-            if off + 4 > len(rom_data):
-                break
+        """
+        Pack every artwork entry into one buffer and write it to the ROM
+        with a single slice assignment. Entries that would run past the end
+        of the ROM are dropped.
+        """
+        count = len(self.artworks)
+        room = (len(rom_data) - ARTWORK_TABLE_BASE) // 4
+        if room <= 0:
+            return
+        count = min(count, room)
 
-            # First halfword: unknown field
-            self._write_u16(rom_data, off, entry.unk_halfword & 0xFFFF)
+        buf = bytearray(rom_data[ARTWORK_TABLE_BASE:ARTWORK_TABLE_BASE + count * 4])
+        pack_into = struct.Struct("<HH").pack_into
+
+        for entry in self.artworks:
+            if entry.index >= count:
+                continue
 
             # Second halfword: card name index or 0xFFFF
             idx = entry.card_name_index
-
             if idx is None or idx == 0xFFFF:
-                self._write_u16(rom_data, off + 2, 0xFFFF)
+                idx = 0xFFFF
             else:
                 idx = int(idx)
                 # Clamp to valid range; if bad, treat as "none"
                 if not (0 <= idx < NUM_CARD_GFX):
                     idx = 0xFFFF
-                self._write_u16(rom_data, off + 2, idx)
+
+            # First halfword: unknown field
+            pack_into(buf, entry.index * 4, entry.unk_halfword & 0xFFFF, idx)
+
+        rom_data[ARTWORK_TABLE_BASE:ARTWORK_TABLE_BASE + count * 4] = buf
+
+    def _set_card_name(self, card, name):
+        """Rename a card, keeping card_names and the list labels in step."""
+        if card.name != name:
+            self._card_list_stale = True
+            self._card_id_choices_stale = True
+            self._reindex_card_name(card.index, self.card_names_lc[card.index], name.lower())
+            self.card_names_lc[card.index] = name.lower()
+            self.card_labels[card.index] = self._card_label(card.index, name)
+            card.text_dirty = True
+        card.name = name
+        self.card_names[card.index] = name
+
+    def _reindex_card_name(self, idx, old_lc, new_lc):
+        """Move card idx in card_name_trigrams from old_lc's trigrams to new_lc's."""
+        index = self.card_name_trigrams
+        old = {old_lc[j:j + 3] for j in range(len(old_lc) - 2)}
+        new = {new_lc[j:j + 3] for j in range(len(new_lc) - 2)}
+        for tri in old - new:
+            posting = index.get(tri)
+            if posting is not None:
+                posting.discard(idx)
+        for tri in new - old:
+            index.setdefault(tri, set()).add(idx)
+
+    @staticmethod
+    def _set_card_desc(card, desc):
+        """Set a card's description, marking its text for the next save."""
+        if card.desc != desc:
+            card.text_dirty = True
+        card.desc = desc
+
+    def _editor_state(self):
+        """
+        Raw contents of every card field apply_changes reads back. Tk
+        variables are read unconverted, so half-typed numbers compare fine.
+        """
+        return (
+            self.desc_text.get("1.0", tk.END),
+            *(self.getvar(str(var)) for var in (
+                self.name_var, self.password_var, self.price_var,
+                self.konami_main_var, self.card_id_main_var, self.artwork_main_var,
+                self.edited_main_var, self.atk_main_var, self.def_main_var,
+                self.level_main_var, self.race_main_var, self.attribute_main_var,
+                self.type_main_var, self.st_race_main_var,
+                self.konami_sec_var, self.card_id_sec_var, self.artwork_sec_var,
+                self.edited_sec_var, self.atk_sec_var, self.def_sec_var,
+                self.level_sec_var, self.race_sec_var, self.attribute_sec_var,
+                self.type_sec_var, self.st_race_sec_var,
+            )),
+            *(combo.get() if combo is not None else None for combo in (
+                self.race_main_combo, self.attribute_main_combo,
+                self.type_main_combo, self.st_race_main_combo,
+                self.race_sec_combo, self.attribute_sec_combo,
+                self.type_sec_combo, self.st_race_sec_combo,
+            )),
+            tuple(self._card_id_ui_index.items()),
+        )
 
     def apply_changes(self):
         if self.current_index is None or not self.cards:
             return
         card = self.cards[self.current_index]
 
-        card.name = self.name_var.get()
-        card.desc = self.desc_text.get("1.0", tk.END).rstrip("\n")
+        # Runs on every card switch; when no field differs from what was
+        # loaded (or last applied), the card already holds these values
+        if self._editor_state() == self._editor_snapshot:
+            self._apply_artwork_ui_to_entry()
+            return
+
+        self._set_card_name(card, self.name_var.get())
+        self._set_card_desc(card, self.desc_text.get("1.0", tk.END).rstrip("\n"))
 
-        def get_index_from_combo(combo, values_list, numeric_var):
+        def get_index_from_combo(combo, lookup, numeric_var):
             if combo is None:
                 return numeric_var.get()
             val = combo.get()
-            if not values_list:
-                try:
-                    return int(val)
-                except ValueError:
-                    return numeric_var.get()
-            if val in values_list:
-                return values_list.index(val)
+            idx = lookup.get(val)
+            if idx is not None:
+                return idx
             try:
                 return int(val)
             except ValueError:
@@ -2660,10 +3436,10 @@ class RomEditorApp(tk.Tk):
         card.atk = self.atk_main_var.get()
         card.deff = self.def_main_var.get()
         card.level = self.level_main_var.get()
-        card.race = get_index_from_combo(self.race_main_combo, self.races_list, self.race_main_var)
-        card.attribute = get_index_from_combo(self.attribute_main_combo, self.attributes_list, self.attribute_main_var)
-        card.type_ = get_index_from_combo(self.type_main_combo, self.types_list, self.type_main_var)
-        card.st_race = get_index_from_combo(self.st_race_main_combo, self.st_races_list, self.st_race_main_var)
+        card.race = get_index_from_combo(self.race_main_combo, self._races_index, self.race_main_var)
+        card.attribute = get_index_from_combo(self.attribute_main_combo, self._attributes_index, self.attribute_main_var)
+        card.type_ = get_index_from_combo(self.type_main_combo, self._types_index, self.type_main_var)
+        card.st_race = get_index_from_combo(self.st_race_main_combo, self._st_races_index, self.st_race_main_var)
 
         # SECONDARY
         card.konami2 = self.konami_sec_var.get()
@@ -2673,10 +3449,10 @@ class RomEditorApp(tk.Tk):
         card.atk2 = self.atk_sec_var.get()
         card.deff2 = self.def_sec_var.get()
         card.level2 = self.level_sec_var.get()
-        card.race2 = get_index_from_combo(self.race_sec_combo, self.races_list, self.race_sec_var)
-        card.attribute2 = get_index_from_combo(self.attribute_sec_combo, self.attributes_list, self.attribute_sec_var)
-        card.type2 = get_index_from_combo(self.type_sec_combo, self.types_list, self.type_sec_var)
-        card.st_race2 = get_index_from_combo(self.st_race_sec_combo, self.st_races_list, self.st_race_sec_var)
+        card.race2 = get_index_from_combo(self.race_sec_combo, self._races_index, self.race_sec_var)
+        card.attribute2 = get_index_from_combo(self.attribute_sec_combo, self._attributes_index, self.attribute_sec_var)
+        card.type2 = get_index_from_combo(self.type_sec_combo, self._types_index, self.type_sec_var)
+        card.st_race2 = get_index_from_combo(self.st_race_sec_combo, self._st_races_index, self.st_race_sec_var)
 
         # --- Misc Info from UI back into card ---
         pw_text = self.password_var.get().strip()
@@ -2702,6 +3478,7 @@ class RomEditorApp(tk.Tk):
         self._update_card_id_choices()
         self._set_card_id_ui(self.card_id_main_var, card.card_id_index, card.konami_id)
         self._set_card_id_ui(self.card_id_sec_var, card.card_id_index2, card.konami2)
+        self._editor_snapshot = self._editor_state()
 
         # Also store current artwork entry edits
         self._apply_artwork_ui_to_entry()
@@ -2722,8 +3499,9 @@ class RomEditorApp(tk.Tk):
 
     def _get_gfx_index_from_current_artwork(self):
         """
-        Uses the current artwork table entry and reads its second halfword
-        ("Card (Name Index)" in the Artwork tab) directly from the ROM.
+        Uses the current artwork table entry and returns its second halfword
+        ("Card (Name Index)" in the Artwork tab), as decoded by
+        _parse_artworks and kept in sync by _apply_artwork_ui_to_entry.
         That value is the 0-based graphics/palette index.
         """
         if self.rom_data is None or not self.artworks:
@@ -2738,15 +3516,11 @@ class RomEditorApp(tk.Tk):
             card = self.cards[self.current_index]
             art_idx = card.artwork_id
 
-        if not (0 <= art_idx < len(self.artworks)):
+        if not (0 <= art_idx < len(self._artwork_gfx_index)):
             return None
 
         # Second halfword = Card (Name Index), 0-based index into card_graphics_indexes / art tables
-        off = ARTWORK_TABLE_BASE + art_idx * 4 + 2
-        if off + 2 > len(self.rom_data):
-            return None
-
-        stored = self._read_u16(self.rom_data, off)
+        stored = self._artwork_gfx_index[art_idx]
         if stored == 0xFFFF:  # if you ever use this sentinel
             return None
 
@@ -2758,22 +3532,13 @@ class RomEditorApp(tk.Tk):
         Build a Pillow 'P' image containing the 144-color icon palette
         from ICON_PAL_BASE (0x510440), padded to 256 colors.
         """
-        pal_raw = self._get_icon_palette()
-        if pal_raw is None:
+        # Same BGR555 -> RGB decode the icon renderer uses, so reuse its cache
+        pal_rgb = self._get_icon_palette_rgb()
+        if pal_rgb is None:
             return None
 
-        # GBA 15-bit color: 0-4 red, 5-9 green, 10-14 blue
-        colors = []
-        for i in range(0, len(pal_raw), 2):
-            val = pal_raw[i] | (pal_raw[i + 1] << 8)
-            r = (val & 0x1F) * 255 // 31
-            g = ((val >> 5) & 0x1F) * 255 // 31
-            b = ((val >> 10) & 0x1F) * 255 // 31
-            colors.extend([r, g, b])
-
         # Pad to 256 entries
-        while len(colors) < 256 * 3:
-            colors.extend([0, 0, 0])
+        colors = list(pal_rgb.ljust(256 * 3, b"\x00"))
 
         pal_img = Image.new("P", (1, 1))
         pal_img.putpalette(colors)
@@ -2798,7 +3563,57 @@ class RomEditorApp(tk.Tk):
               * 0   -> 0
               * 1..128 -> 16..143 (p -> p-1+16)
           - Attach original ROM palette and return.
+
+        If every colour in the image is already an allowed palette colour
+        (templates are drawn with it), indices are looked up exactly and
+        the quantizer is skipped.
+
+        Both palettes are built once per ROM (see _get_icon_quant_palettes).
+        """
+        full_pal, tmp_pal_img, exact = self._get_icon_quant_palettes()
+
+        # The composed icons are already RGB, so only convert (which always
+        # copies) when needed.
+        if img_rgb.mode != "RGB":
+            img_rgb = img_rgb.convert("RGB")
+
+        # getcolors() gives up (None) as soon as there are more distinct
+        # colours than the palette has, so off-palette images bail early.
+        colors = img_rgb.getcolors(len(exact))
+        if colors is not None and all(rgb in exact for _count, rgb in colors):
+            px = iter(img_rgb.tobytes())
+            out = Image.frombytes(
+                "P", img_rgb.size, bytes(map(exact.__getitem__, zip(px, px, px)))
+            )
+        else:
+            # Quantize using the restricted palette. Pillow's palette
+            # mapping runs in C with its own colour cache.
+            q = img_rgb.quantize(
+                palette=tmp_pal_img,
+                dither=Image.NONE
+            )
+
+            # Remap indices:
+            #   0      -> 0
+            #   1..128 -> 16..143  (p -> p - 1 + 16)
+            #   other  -> 0    (shouldn't happen, clamp as a fallback)
+            out = q.point(ICON_QUANT_REMAP)
+        # Attach the original ROM icon palette so indices map correctly
+        out.putpalette(full_pal)
+
+        return out
+
+    def _get_icon_quant_palettes(self):
+        """
+        Return (full_pal, tmp_pal_img, exact) for _quantize_to_icon_palette:
+        the full 256-color icon palette as a flat RGB list, a 'P' image
+        holding the restricted palette (0, then 16..143), and a dict from
+        each allowed (R, G, B) colour to its final icon index.
+        Cached until the next ROM load.
         """
+        if self._icon_quant_pal_cache is not None:
+            return self._icon_quant_pal_cache
+
         pal_img = self._build_pillow_icon_palette()
         if pal_img is None:
             raise RuntimeError("Icon palette not available")
@@ -2823,34 +3638,14 @@ class RomEditorApp(tk.Tk):
         tmp_pal_img = Image.new("P", (1, 1))
         tmp_pal_img.putpalette(tmp_pal_list)
 
-        # Quantize using the restricted palette
-        q = img_rgb.convert("RGB").quantize(
-            palette=tmp_pal_img,
-            dither=Image.NONE
-        )
-
-        # Remap indices:
-        #   0      -> 0
-        #   1..128 -> 16..143  (p -> p - 1 + 16)
-        q_data = list(q.getdata())
-        remapped = []
-        for p in q_data:
-            p = int(p)
-            if p == 0:
-                new_idx = 0
-            elif 1 <= p <= 128:
-                new_idx = (p - 1) + 16  # 16..143
-            else:
-                # Shouldn't happen, but clamp to 0 as a fallback
-                new_idx = 0
-            remapped.append(new_idx & 0xFF)
-
-        out = Image.new("P", q.size)
-        out.putdata(remapped)
-        # Attach the original ROM icon palette so indices map correctly
-        out.putpalette(full_pal)
+        # Exact colour -> index for the allowed entries; when a colour
+        # repeats, the first entry wins, as it would when quantizing
+        exact = {}
+        for idx in (0, *range(16, 144)):
+            exact.setdefault(tuple(full_pal[idx * 3:idx * 3 + 3]), idx)
 
-        return out
+        self._icon_quant_pal_cache = (full_pal, tmp_pal_img, exact)
+        return self._icon_quant_pal_cache
 
     def load_card_graphics(self):
         """
@@ -2859,8 +3654,7 @@ class RomEditorApp(tk.Tk):
 
           - resize to 80x80
           - reduce to 64 colors
-          - flip each 8x8 tile horizontally
-          - convert to 6bpp via custom gbagfx
+          - tile and pack to 6bpp, palette to BGR555
           - insert at CARD_GFX_BASE / CARD_PAL_BASE for this graphics index
         """
         if self.rom_data is None or not self.cards:
@@ -2915,11 +3709,25 @@ class RomEditorApp(tk.Tk):
     # SEARCH & KONAMI TRACES
     # =========================
 
+    def _schedule_filter(self, event=None):
+        """
+        Debounce typing: only filter once the user pauses for 150 ms.
+        """
+        self._cancel_scheduled_filter()
+        self._filter_after_id = self.after(150, self.apply_filter)
+
+    def _cancel_scheduled_filter(self):
+        if self._filter_after_id is not None:
+            self.after_cancel(self._filter_after_id)
+            self._filter_after_id = None
+
     def apply_filter(self):
+        self._cancel_scheduled_filter()
         text = self.search_var.get().strip()
         self._populate_card_list(text)
 
     def clear_filter(self):
+        self._cancel_scheduled_filter()
         self.search_var.set("")
         self._populate_card_list("")
 
@@ -2995,6 +3803,15 @@ class PackEditorWindow(tk.Toplevel):
         # Contents vars
         self.card_vars = []    # list[StringVar] for Konami IDs (dropdown labels)
         self.rarity_vars = []  # list[StringVar] rarity names
+        self._content_rows = []  # pooled row widgets, reused across packs
+        self._editor_row = None  # contents row the shared card dropdown is over
+
+        self._filter_cache = OrderedDict()  # pattern -> matching choice indices (LRU)
+        self._filter_after_id = None
+
+        # Mouse wheel steps are summed and applied at most once per frame
+        self._wheel_accum = 0
+        self._wheel_after = None
 
         self._build_ui()
         if self.packs:
@@ -3014,11 +3831,7 @@ class PackEditorWindow(tk.Toplevel):
         self.current_pack_index = idx
         pack = self.packs[idx]
 
-        name = ""
-        if 0 <= pack.index < len(self.app.pack_names):
-            name = self.app.pack_names[pack.index].strip()
-        if not name:
-            name = f"Pack {pack.index}"
+        name = self.app.pack_display_names[pack.index]
 
         self.pack_info_label.config(
             text=f"{name} (index {pack.index}) @ 0x{pack.struct_off:08X}"
@@ -3043,22 +3856,68 @@ class PackEditorWindow(tk.Toplevel):
         self._rebuild_contents()
 
     def _label_for_konami(self, kid):
-        idx = self.app.konami_to_deck_choice_index.get(kid)
-        if idx is not None:
+        idx = self.app.konami_to_choice_arr[kid]
+        if idx >= 0:
             return self.app.deck_card_choices[idx]
         return f"{kid:04d}"
 
     def _filter_card_combo(self, event, combo: ttk.Combobox, var: tk.StringVar):
+        """
+        Debounce typing: only filter once the user pauses for 150 ms.
+        """
+        if self._filter_after_id is not None:
+            self.after_cancel(self._filter_after_id)
+        self._filter_after_id = self.after(150, self._do_filter_card_combo, combo, var)
+
+    def _do_filter_card_combo(self, combo: ttk.Combobox, var: tk.StringVar):
+        self._filter_after_id = None
+        if not combo.winfo_exists():
+            return
+
         pattern = var.get().lower()
         if not pattern:
-            filtered = self.app.deck_card_choices
-        else:
-            filtered = [lbl for lbl in self.app.deck_card_choices if pattern in lbl.lower()]
-        combo["values"] = filtered
+            combo["values"] = self.app.deck_card_choices_tuple
+            combo._filtered = False
+            return
+
+        choices = self.app.deck_card_choices
+        combo["values"] = [choices[i] for i in self._filter_choice_indices(pattern)]
+        combo._filtered = True
+
+    def _filter_choice_indices(self, pattern):
+        """
+        Return indices into app.deck_card_choices whose label contains
+        pattern (already lowercased). Results are cached per pattern; a new
+        pattern that extends a cached one only rescans the cached matches.
+        """
+        cache = self._filter_cache
+        matches = cache.get(pattern)
+        if matches is not None:
+            cache.move_to_end(pattern)
+            return matches
+
+        candidates = None
+        for end in range(len(pattern) - 1, 0, -1):
+            candidates = cache.get(pattern[:end])
+            if candidates is not None:
+                break
+        if candidates is None:
+            candidates = range(len(self.app.deck_card_choices_lc))
+
+        pat, lower = self.app._filter_corpus(pattern)
+        matches = [i for i in candidates if pat in lower[i]]
+
+        cache[pattern] = matches
+        if len(cache) > FILTER_CACHE_SIZE:
+            cache.popitem(last=False)
+        return matches
 
     def _rebuild_contents(self):
         pack = self.packs[self.current_pack_index]
 
+        # Callers apply the UI first, so an open editor has nothing to keep
+        self._close_card_editor(commit=False)
+
         # normalize contents length to card_amount
         n = max(0, self.card_amount_var.get())
         pack.card_amount = n
@@ -3068,51 +3927,156 @@ class PackEditorWindow(tk.Toplevel):
             pack.contents.append((default_kid, 0))
         pack.contents = pack.contents[:n]
 
-        # clear old widgets
-        for child in self.contents_inner.winfo_children():
-            child.destroy()
-        self.card_vars = []
-        self.rarity_vars = []
-
-        for i, (kid, rar) in enumerate(pack.contents):
-            row = i
-            tk.Label(self.contents_inner, text=f"{i+1:02d}").grid(row=row, column=0, sticky="e", padx=2, pady=1)
-
-            # Card ID dropdown
-            card_var = tk.StringVar()
-            card_var.set(self._label_for_konami(kid))
-            card_combo = ttk.Combobox(
-                self.contents_inner,
-                textvariable=card_var,
-                values=self.app.deck_card_choices,
-                width=30
-            )
-            card_combo.grid(row=row, column=1, sticky="w", padx=2, pady=1)
-            card_combo.bind(
-                "<KeyRelease>",
-                lambda e, cb=card_combo, v=card_var: self._filter_card_combo(e, cb, v)
-            )
-            self.card_vars.append(card_var)
+        # Reuse pooled rows; only create the ones we don't have yet and
+        # hide (not destroy) any left over from a larger pack.
+        rows = self._content_rows
+        while len(rows) < n:
+            rows.append(self._create_content_row(len(rows)))
+
+        for i, row in enumerate(rows):
+            widgets = (row["label"], row["card_label"], row["rar_combo"])
+            if i >= n:
+                if row["shown"]:
+                    for w in widgets:
+                        w.grid_remove()
+                    row["shown"] = False
+                continue
+            if not row["shown"]:
+                for w in widgets:
+                    w.grid()
+                row["shown"] = True
+
+            kid, rar = pack.contents[i]
+            row["card_var"].set(self._label_for_konami(kid))
 
-            # Rarity dropdown
-            rarity_var = tk.StringVar()
             rar_idx = rar if 0 <= rar < len(self.app.rarities) else 0
-            rarity_var.set(self.app.rarities[rar_idx])
-            rar_combo = ttk.Combobox(
-                self.contents_inner,
-                textvariable=rarity_var,
-                values=self.app.rarities,
-                width=18,
-                state="readonly"
-            )
-            rar_combo.grid(row=row, column=2, sticky="w", padx=2, pady=1)
-            self.rarity_vars.append(rarity_var)
+            row["rar_var"].set(self.app.rarities[rar_idx])
+
+        self.card_vars = [row["card_var"] for row in rows[:n]]
+        self.rarity_vars = [row["rar_var"] for row in rows[:n]]
+
+    def _create_content_row(self, i):
+        """Create the widgets for contents row i (01-based label) and grid them."""
+        label = tk.Label(self.contents_inner, text=f"{i+1:02d}")
+        label.grid(row=i, column=0, sticky="e", padx=2, pady=1)
+
+        # Card ID: a plain label; clicking it opens the shared dropdown
+        card_var = tk.StringVar()
+        card_label = tk.Label(
+            self.contents_inner,
+            textvariable=card_var,
+            width=30,
+            anchor="w",
+            relief="groove"
+        )
+        card_label.grid(row=i, column=1, sticky="w", padx=2, pady=1)
+
+        # Rarity dropdown
+        rar_var = tk.StringVar()
+        rar_combo = ttk.Combobox(
+            self.contents_inner,
+            textvariable=rar_var,
+            values=self.app.rarities,
+            width=18,
+            state="readonly"
+        )
+        rar_combo.grid(row=i, column=2, sticky="w", padx=2, pady=1)
+
+        row = {
+            "index": i,
+            "label": label,
+            "card_label": card_label,
+            "card_var": card_var,
+            "rar_combo": rar_combo,
+            "rar_var": rar_var,
+            "shown": True,
+        }
+        card_label.bind("<Button-1>", lambda e, r=row: self._open_card_editor(r))
+        return row
+
+    # ---- shared card editor ----
+
+    def _build_card_editor(self):
+        """
+        One card dropdown for the whole window, gridded over whichever
+        contents row is clicked, instead of a ttk.Combobox per row.
+        """
+        self._editor_var = tk.StringVar()
+        self._editor_combo = ttk.Combobox(
+            self.contents_inner,
+            textvariable=self._editor_var,
+            values=self.app.deck_card_choices_tuple,
+            width=30
+        )
+
+        def _on_key(e):
+            if e.keysym in ("Return", "Escape", "Tab"):
+                return
+            self._filter_card_combo(e, self._editor_combo, self._editor_var)
+
+        self._editor_combo.bind("<KeyRelease>", _on_key)
+        self._editor_combo.bind("<<ComboboxSelected>>", lambda e: self._close_card_editor())
+        self._editor_combo.bind("<Return>", lambda e: self._close_card_editor())
+        self._editor_combo.bind("<Escape>", lambda e: self._close_card_editor(commit=False))
+        self._editor_combo.bind("<FocusOut>", lambda e: self.after_idle(self._on_editor_focus_out))
+
+    def _open_card_editor(self, row):
+        if row is self._editor_row:
+            return
+        self._close_card_editor()
+
+        self._editor_row = row
+        cmb = self._editor_combo
+        # Drop any filter left over from the previous edit
+        if getattr(cmb, "_filtered", False):
+            cmb.configure(values=self.app.deck_card_choices_tuple)
+            cmb._filtered = False
+        self._editor_var.set(row["card_var"].get())
+
+        cmb.grid(row=row["index"], column=1, sticky="w", padx=2, pady=1)
+        cmb.lift()
+        cmb.focus_set()
+        cmb.select_range(0, tk.END)
+        cmb.icursor(tk.END)
+
+    def _on_editor_focus_out(self):
+        # Opening the dropdown moves focus to its popdown listbox, which
+        # lives under the combobox's path; that's not the end of the edit.
+        focus = self.tk.call("focus")
+        if focus and str(focus).startswith(str(self._editor_combo)):
+            return
+        self._close_card_editor()
+
+    def _close_card_editor(self, commit=True):
+        row = self._editor_row
+        if row is None:
+            return
+        self._editor_row = None
+        if commit:
+            row["card_var"].set(self._editor_var.get())
+        self._editor_combo.grid_remove()
+
+    def _on_contents_wheel(self, event):
+        if not str(event.widget).startswith(str(self.contents_canvas)):
+            return
+        self._wheel_accum += _wheel_steps(event)
+        if self._wheel_after is None:
+            self._wheel_after = self.after(16, self._flush_contents_wheel)
+
+    def _flush_contents_wheel(self):
+        self._wheel_after = None
+        steps, self._wheel_accum = self._wheel_accum, 0
+        if steps:
+            self.contents_canvas.yview_scroll(steps, "units")
 
     def _apply_ui_to_pack(self):
         if not self.packs:
             return
         pack = self.packs[self.current_pack_index]
 
+        # Flush an edit still open in the shared card dropdown
+        self._close_card_editor()
+
         # header
         try:
             pack.cost = int(self.cost_var.get()) & 0xFFFF
@@ -3153,20 +4117,14 @@ class PackEditorWindow(tk.Toplevel):
         new_contents = []
         for card_var, rar_var in zip(self.card_vars, self.rarity_vars):
             lbl = card_var.get()
-            if ":" in lbl:
-                kid_txt = lbl.split(":", 1)[0].strip()
-            else:
-                kid_txt = lbl.strip()
+            # partition() returns the whole label as head when there is
+            # no ':', so bare numbers need no separate branch
             try:
-                kid = int(kid_txt)
+                kid = int(lbl.partition(":")[0])
             except ValueError:
                 kid = 0
 
-            rar_name = rar_var.get()
-            if rar_name in self.app.rarities:
-                rar_idx = self.app.rarities.index(rar_name)
-            else:
-                rar_idx = 0
+            rar_idx = self.app._rarities_index.get(rar_var.get(), 0)
 
             new_contents.append((kid & 0xFFFF, rar_idx & 0xFFFF))
 
@@ -3195,23 +4153,20 @@ class PackEditorWindow(tk.Toplevel):
         left_frame = tk.Frame(main_frame)
         left_frame.pack(side=tk.LEFT, fill=tk.Y)
 
+        # populate (one Tcl list assignment instead of an insert per pack)
+        display = self.app.pack_display_names
+        self._pack_names_var = tk.StringVar(value=tuple(display[p.index] for p in self.packs))
+
         tk.Label(left_frame, text="Packs").pack(anchor="w")
-        self.pack_listbox = tk.Listbox(left_frame, width=32, height=20)
+        self.pack_listbox = tk.Listbox(
+            left_frame, width=32, height=20, listvariable=self._pack_names_var
+        )
         self.pack_listbox.pack(side=tk.LEFT, fill=tk.Y)
         sb = tk.Scrollbar(left_frame, orient=tk.VERTICAL, command=self.pack_listbox.yview)
         sb.pack(side=tk.RIGHT, fill=tk.Y)
         self.pack_listbox.config(yscrollcommand=sb.set)
         self.pack_listbox.bind("<<ListboxSelect>>", self._on_pack_selected)
 
-        # populate
-        for p in self.packs:
-            name = ""
-            if 0 <= p.index < len(self.app.pack_names):
-                name = self.app.pack_names[p.index].strip()
-            if not name:
-                name = f"Pack {p.index}"
-            self.pack_listbox.insert(tk.END, name)
-
         # Right: pack details
         right_frame = tk.Frame(main_frame)
         right_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(8, 0))
@@ -3259,12 +4214,17 @@ class PackEditorWindow(tk.Toplevel):
 
         self.contents_inner = tk.Frame(self.contents_canvas)
         self.contents_canvas.create_window((0, 0), window=self.contents_inner, anchor="nw")
+        self._build_card_editor()
 
         def _on_inner_config(event):
             self.contents_canvas.configure(scrollregion=self.contents_canvas.bbox("all"))
 
         self.contents_inner.bind("<Configure>", _on_inner_config)
 
+        # Wheel events over any row reach the toplevel's bindtag too
+        for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.bind(seq, self._on_contents_wheel, add="+")
+
         # Buttons
         btn_frame = tk.Frame(right_frame)
         btn_frame.pack(fill=tk.X, pady=(6, 0))
@@ -3486,29 +4446,96 @@ class DeckEditorWindow(tk.Toplevel):
         self.unk_vars = [tk.StringVar() for _ in range(4)]
         self.main_count_var = tk.IntVar()
         self.extra_count_var = tk.IntVar()
-        self.main_card_vars = []   # list[StringVar]
-        self.extra_card_vars = []  # list[StringVar]
+
+        # Card rows are virtualized: deck.main_cards / deck.extra_cards hold
+        # the data, and a small pool of row widgets per column is moved
+        # around the canvas to show only the slots currently in view.
+        # Rows are plain labels; one shared combobox is laid over the row
+        # being edited.
+        self._main_rows = []     # list[dict] pooled rows for the main deck column
+        self._extra_rows = []    # list[dict] pooled rows for the extra deck column
+        self._row_height = None  # measured from the first row created
+        self._col_width = None
+        self._list_top = 20      # room for the column headers
+        self._num_width = 28     # room for the slot numbers drawn left of each row
+        self._row_label_ids = [] # canvas text items for the slot numbers
+        self._render_after_id = None
+
+        # Mouse wheel steps are summed and applied at most once per frame
+        self._wheel_accum = 0
+        self._wheel_after = None
+
+        # Card dropdown filtering (debounced; narrows the previous result
+        # when the pattern is extended)
+        self._filter_after_id = None
+        self._last_filter = {"pattern": "", "result": None}
 
         self._build_ui()
         if self.decks:
             self._load_deck_into_editor(0)
 
     def _filter_card_combo(self, event, combo: ttk.Combobox, var: tk.StringVar):
+        """
+        Debounce typing: only filter once the user pauses for 50 ms.
+        """
+        if self._filter_after_id is not None:
+            self.after_cancel(self._filter_after_id)
+        self._filter_after_id = self.after(50, self._do_filter_card_combo, combo, var)
+
+    def _do_filter_card_combo(self, combo: ttk.Combobox, var: tk.StringVar):
         """
         Filter card choices in this combobox based on current text.
+        Only the first DECK_FILTER_LIMIT matches are handed to Tk.
         """
+        self._filter_after_id = None
+        if not combo.winfo_exists():
+            return
+
         pattern = var.get().lower()
         if not pattern:
-            filtered = self.app.deck_card_choices
+            # Full list goes back in when the dropdown is next opened
+            combo._filtered = False
+            return
+
+        # If the new pattern extends the previous one, only the previous
+        # matches can still match.
+        # Otherwise let the trigram index rule out most labels up front.
+        last = self._last_filter
+        if last["result"] is not None and last["pattern"] and pattern.startswith(last["pattern"]):
+            candidates = last["result"]
         else:
-            filtered = [
-                lbl for lbl in self.app.deck_card_choices
-                if pattern in lbl.lower()
-            ]
-        combo["values"] = filtered
+            candidates = self.app._trigram_candidates(self.app.deck_choice_trigrams, pattern)
+            if candidates is None:
+                candidates = range(len(self.app.deck_card_choices_lc))
+
+        pat, lower = self.app._filter_corpus(pattern)
+        matches = [i for i in candidates if pat in lower[i]]
+        self._last_filter = {"pattern": pattern, "result": matches}
+
+        choices = self.app.deck_card_choices
+        filtered = tuple(choices[i] for i in islice(matches, DECK_FILTER_LIMIT))
+        combo._filtered = True
+        self._set_combo_values(combo, filtered)
         # Optional: open dropdown as you type
         # combo.event_generate("<Down>")
 
+    def _fill_card_combo(self, combo: ttk.Combobox):
+        """
+        postcommand for the card dropdowns: they are created empty and only
+        get the full choice list when opened without an active filter.
+        """
+        if not getattr(combo, "_filtered", False):
+            self._set_combo_values(combo, self.app.deck_card_choices_tuple)
+
+    @staticmethod
+    def _set_combo_values(combo: ttk.Combobox, values):
+        """Push values to Tk only when they differ from what the widget has."""
+        last = getattr(combo, "_last_values", None)
+        if last is values or last == values:
+            return
+        combo.configure(values=values)
+        combo._last_values = values
+
     def _build_ui(self):
         main_frame = tk.Frame(self)
         main_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
@@ -3517,22 +4544,20 @@ class DeckEditorWindow(tk.Toplevel):
         left_frame = tk.Frame(main_frame)
         left_frame.pack(side=tk.LEFT, fill=tk.Y)
 
+        # populate (one Tcl list assignment instead of an insert per deck)
+        display = self.app.deck_display_names
+        self._deck_names_var = tk.StringVar(value=tuple(display[d.index] for d in self.decks))
+
         tk.Label(left_frame, text="Decks").pack(anchor="w")
-        self.deck_listbox = tk.Listbox(left_frame, width=24, height=20)
+        self.deck_listbox = tk.Listbox(
+            left_frame, width=24, height=20, listvariable=self._deck_names_var
+        )
         self.deck_listbox.pack(side=tk.LEFT, fill=tk.Y)
         sb = tk.Scrollbar(left_frame, orient=tk.VERTICAL, command=self.deck_listbox.yview)
         sb.pack(side=tk.RIGHT, fill=tk.Y)
         self.deck_listbox.config(yscrollcommand=sb.set)
         self.deck_listbox.bind("<<ListboxSelect>>", self._on_deck_selected)
 
-        for d in self.decks:
-            name = ""
-            if 0 <= d.index < len(self.app.deck_names):
-                name = self.app.deck_names[d.index].strip()
-            if not name:
-                name = f"Deck {d.index}"
-            self.deck_listbox.insert(tk.END, name)
-
         # Right: deck details
         right_frame = tk.Frame(main_frame)
         right_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(8, 0))
@@ -3567,44 +4592,79 @@ class DeckEditorWindow(tk.Toplevel):
         lists_outer = tk.Frame(right_frame)
         lists_outer.pack(fill=tk.BOTH, expand=True, pady=4)
 
-        self.lists_canvas = tk.Canvas(lists_outer, borderwidth=0)
+        self.lists_canvas = tk.Canvas(lists_outer, borderwidth=0, height=400)
         self.lists_canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
-        lists_scrollbar = tk.Scrollbar(
+        self._lists_scrollbar = tk.Scrollbar(
             lists_outer,
             orient="vertical",
             command=self.lists_canvas.yview
         )
-        lists_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-
-        self.lists_canvas.configure(yscrollcommand=lists_scrollbar.set)
+        self._lists_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
-        # Inner frame that actually holds the main/extra frames
-        self.lists_inner = tk.Frame(self.lists_canvas)
-        self.lists_canvas.create_window((0, 0), window=self.lists_inner, anchor="nw")
+        # Any change of view (scrollbar, resize, new scrollregion) re-renders
+        # the rows that are now visible.
+        self.lists_canvas.configure(yscrollcommand=self._on_lists_yview)
+        self.lists_canvas.bind("<Configure>", lambda e: self._schedule_render())
 
-        def _on_inner_config(event):
-            # Update scrollregion when content size changes
-            self.lists_canvas.configure(scrollregion=self.lists_canvas.bbox("all"))
+        # Wheel events over any row reach the toplevel's bindtag too
+        for seq in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.bind(seq, self._on_lists_wheel, add="+")
 
-        self.lists_inner.bind("<Configure>", _on_inner_config)
+        self._main_header_id = self.lists_canvas.create_text(
+            2, 2, anchor="nw", text="Main Deck"
+        )
+        self._extra_header_id = self.lists_canvas.create_text(
+            2, 2, anchor="nw", text="Extra Deck"
+        )
 
-        # Now create main/extra frames inside the inner frame
-        self.main_cards_frame = tk.LabelFrame(self.lists_inner, text="Main Deck")
-        self.main_cards_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 4))
+        # The one card dropdown, moved over whichever slot is clicked
+        self._editor_row = None      # pooled row being edited, if any
+        self._editor_dirty = False   # user typed free text into the editor
+        self._editor_var = tk.StringVar()
+        self._editor_combo = ttk.Combobox(
+            self.lists_canvas,
+            textvariable=self._editor_var,
+            values=(),
+            width=30
+        )
+        self._editor_combo.configure(
+            postcommand=lambda: self._fill_card_combo(self._editor_combo)
+        )
+        self._editor_combo._bound_kid = 0  # Konami ID currently in the editor
+        self._editor_window = self.lists_canvas.create_window(
+            0, 0, window=self._editor_combo, anchor="nw", state="hidden"
+        )
 
-        self.extra_cards_frame = tk.LabelFrame(self.lists_inner, text="Extra Deck")
-        self.extra_cards_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(4, 0))
+        def _on_editor_key(e):
+            if e.keysym in ("Return", "Escape", "Tab"):
+                return
+            self._editor_dirty = True
+            self._filter_card_combo(e, self._editor_combo, self._editor_var)
+
+        def _on_editor_selected(e):
+            # A picked entry is always a "kid: name" label; parse it once
+            self._editor_combo._bound_kid = self._parse_card_label(self._editor_var.get())
+            self._editor_dirty = False
+            self._close_card_editor()
+
+        # Filter on typing; write the edit back to the deck when done
+        self._editor_combo.bind("<KeyRelease>", _on_editor_key)
+        self._editor_combo.bind("<<ComboboxSelected>>", _on_editor_selected)
+        self._editor_combo.bind("<Return>", lambda e: self._close_card_editor())
+        self._editor_combo.bind("<Escape>", lambda e: self._close_card_editor(commit=False))
+        self._editor_combo.bind("<FocusOut>", lambda e: self.after_idle(self._on_editor_focus_out))
 
         # Bottom: buttons
         btn_frame = tk.Frame(right_frame)
         btn_frame.pack(fill=tk.X, pady=(6, 0))
 
-        tk.Button(
+        self.import_ydk_button = tk.Button(
             btn_frame,
             text="Import YDK...",
             command=self._import_ydk
-        ).pack(side=tk.LEFT)
+        )
+        self.import_ydk_button.pack(side=tk.LEFT)
 
         tk.Button(
             btn_frame,
@@ -3618,58 +4678,34 @@ class DeckEditorWindow(tk.Toplevel):
             command=self.destroy
         ).pack(side=tk.RIGHT)
 
-    def _parse_ydk_file(self, path):
+    @staticmethod
+    def _parse_ydk_file(path):
         """
         Parse a .ydk file and return (main_pw_list, extra_pw_list),
         where each list contains integer passwords from #main / #extra.
+        Raises on read errors; this runs off the Tk thread, so it must not
+        touch any widgets.
         """
         main_pw = []
         extra_pw = []
-        section = None
-
-        try:
-            with open(path, "r", encoding="utf-8", errors="ignore") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-
-                    # Strip full-line comments beginning with --
-                    if line.startswith("--"):
-                        continue
-
-                    # Strip inline comments after --
-                    comment_pos = line.find("--")
-                    if comment_pos != -1:
-                        line = line[:comment_pos].strip()
-                        if not line:
-                            continue  # Line becomes empty after removing comment
-
-                    # YDK section markers (#main, #extra, #side)
-                    if line.startswith("#"):
-                        if line.lower() == "#main":
-                            section = "main"
-                        elif line.lower() == "#extra":
-                            section = "extra"
-                        elif line.lower() == "#side":
-                            section = None  # ignore side deck
-                        continue
-
-                    # Some YDK variants mark comments with '!'
-                    if line.startswith("!"):
-                        continue
-
-                    # Now read card-password lines if we're in #main or #extra
-                    if section in ("main", "extra"):
-                        if line.isdigit():
-                            val = int(line)
-                            if section == "main":
-                                main_pw.append(val)
-                            else:
-                                extra_pw.append(val)
-        except Exception as e:
-            messagebox.showerror("YDK Error", f"Failed to read YDK file:\n{e}")
-            return [], []
+        target = None  # list we're currently appending to (None = ignore)
+
+        with open(path, "rb") as f:
+            data = f.read()
+
+        for m in YDK_LINE_RE.finditer(data):
+            marker, pw = m.groups()
+            if marker is not None:
+                # YDK section markers (#main, #extra, #side)
+                marker = marker.lower()
+                if marker == b"main":
+                    target = main_pw
+                elif marker == b"extra":
+                    target = extra_pw
+                else:
+                    target = None  # ignore side deck
+            elif target is not None:
+                target.append(int(pw))
 
         return main_pw, extra_pw
 
@@ -3689,11 +4725,6 @@ class DeckEditorWindow(tk.Toplevel):
             messagebox.showinfo("Deck Editor", "No decks available.")
             return
 
-        deck = self.decks[self.current_deck_index]
-
-        # Make sure we have the latest UI->deck values
-        self._apply_ui_to_deck()
-
         path = filedialog.askopenfilename(
             title="Select YDK deck file",
             filetypes=[("YGOPro Deck Files", "*.ydk"), ("All Files", "*.*")]
@@ -3701,7 +4732,40 @@ class DeckEditorWindow(tk.Toplevel):
         if not path:
             return
 
-        main_pw, extra_pw = self._parse_ydk_file(path)
+        # Read and scan the file on a worker thread so a large or slow
+        # (network) file doesn't freeze the editor; the deck itself is only
+        # modified back on the Tk thread in _finish_ydk_import.
+        self.import_ydk_button.config(state=tk.DISABLED)
+        threading.Thread(
+            target=self._parse_ydk_worker,
+            args=(path, self.current_deck_index),
+            daemon=True,
+        ).start()
+
+    def _parse_ydk_worker(self, path, deck_index):
+        main_pw, extra_pw, error = [], [], None
+        try:
+            main_pw, extra_pw = self._parse_ydk_file(path)
+        except Exception as e:
+            error = e
+        try:
+            self.after(0, self._finish_ydk_import, deck_index, main_pw, extra_pw, error)
+        except (RuntimeError, tk.TclError):
+            pass  # window/app closed while we were parsing
+
+    def _finish_ydk_import(self, deck_index, main_pw, extra_pw, error):
+        if not self.winfo_exists():
+            return
+        self.import_ydk_button.config(state=tk.NORMAL)
+
+        if error is not None:
+            messagebox.showerror("YDK Error", f"Failed to read YDK file:\n{error}", parent=self)
+            return
+
+        # Make sure we have the latest UI->deck values
+        self._apply_ui_to_deck()
+
+        deck = self.decks[deck_index]
         app = self.app
 
         if not main_pw and not extra_pw:
@@ -3719,24 +4783,20 @@ class DeckEditorWindow(tk.Toplevel):
               - passwords that don't exist in the ROM are skipped and do NOT
                 advance target_index.
             """
-            changed = False
-            target_index = 0
-
-            for pw in pw_list:
-                konami_id = app.password_to_konami.get(pw)
-                if konami_id is None:
-                    # Not present in this ROM; skip without advancing target_index
-                    continue
-
-                if target_index < len(cards_list):
-                    cards_list[target_index] = konami_id & 0xFFFF
-                else:
-                    cards_list.append(konami_id & 0xFFFF)
+            # Resolve every password in one pass; map() does the dict
+            # lookups in C. Passwords not present in this ROM drop out here.
+            kids = [
+                konami_id & 0xFFFF
+                for konami_id in map(app.password_to_konami.get, pw_list)
+                if konami_id is not None
+            ]
 
-                target_index += 1
-                changed = True
+            # Overwrite the leading slots, then grow the deck by the rest
+            overlay_len = min(len(kids), len(cards_list))
+            cards_list[:overlay_len] = kids[:overlay_len]
+            cards_list.extend(kids[overlay_len:])
 
-            return changed
+            return bool(kids)
 
         # Fill main and extra lists
         main_changed = fill_deck_slots_sequential(main_pw, deck.main_cards)
@@ -3749,12 +4809,15 @@ class DeckEditorWindow(tk.Toplevel):
             )
             return
 
-        # Update counts based on new sizes
-        self.main_count_var.set(len(deck.main_cards))
-        self.extra_count_var.set(len(deck.extra_cards))
+        # The user may have switched decks while the file was being read;
+        # the import still lands in the deck it was started on.
+        if deck_index == self.current_deck_index:
+            # Update counts based on new sizes
+            self.main_count_var.set(len(deck.main_cards))
+            self.extra_count_var.set(len(deck.extra_cards))
 
-        # Rebuild UI lists to reflect changes
-        self._rebuild_card_lists()
+            # Rebuild UI lists to reflect changes
+            self._rebuild_card_lists()
 
         messagebox.showinfo("YDK Import", "YDK deck imported into current deck.")
 
@@ -3774,11 +4837,7 @@ class DeckEditorWindow(tk.Toplevel):
         self.current_deck_index = idx
         deck = self.decks[idx]
 
-        name = ""
-        if 0 <= deck.index < len(self.app.deck_names):
-            name = self.app.deck_names[deck.index].strip()
-        if not name:
-            name = f"Deck {deck.index}"
+        name = self.app.deck_display_names[deck.index]
 
         self.deck_info_label.config(
             text=f"{name} (index {deck.index}) @ 0x{deck.struct_off:08X} (size {deck.original_size} bytes)"
@@ -3792,6 +4851,7 @@ class DeckEditorWindow(tk.Toplevel):
         self.extra_count_var.set(len(deck.extra_cards))
 
         self._rebuild_card_lists()
+        self.lists_canvas.yview_moveto(0)
 
         # select in listbox
         self.deck_listbox.selection_clear(0, tk.END)
@@ -3803,82 +4863,266 @@ class DeckEditorWindow(tk.Toplevel):
         self._rebuild_card_lists()
 
     def _rebuild_card_lists(self):
+        """
+        Resize the current deck's card lists to the requested counts and
+        re-render the visible rows. Only the pooled row widgets exist; each
+        is rebound to whatever slot scrolls into view.
+        """
         deck = self.decks[self.current_deck_index]
 
         # Normalize counts vs list lengths
         main_count = max(0, self.main_count_var.get())
         extra_count = max(0, self.extra_count_var.get())
 
-        # Grow / shrink lists to match counts
-        while len(deck.main_cards) < main_count:
-            # default to first known Konami ID
-            if self.app.deck_card_choice_konami:
-                deck.main_cards.append(self.app.deck_card_choice_konami[0])
-            else:
-                deck.main_cards.append(0)
-        deck.main_cards = deck.main_cards[:main_count]
+        # Grow / shrink lists to match counts, in place;
+        # new slots default to the first known Konami ID
+        default = self.app.deck_card_choice_konami[0] if self.app.deck_card_choice_konami else 0
+        for cards, count in ((deck.main_cards, main_count), (deck.extra_cards, extra_count)):
+            if len(cards) < count:
+                cards.extend([default] * (count - len(cards)))
+            del cards[count:]
+
+        # Measure row geometry once, from a real pooled row; rows must be
+        # tall enough for the editor combobox to sit over them.
+        if self._row_height is None:
+            self._main_rows.append(self._create_card_row("main"))
+            frame = self._main_rows[0]["frame"]
+            frame.update_idletasks()
+            self._row_height = max(frame.winfo_reqheight(),
+                                   self._editor_combo.winfo_reqheight()) + 2
+            self._col_width = self._num_width + frame.winfo_reqwidth() + 8
+            self.lists_canvas.coords(self._extra_header_id, self._col_width + 2, 2)
+            # One scroll "unit" = one row
+            self.lists_canvas.configure(width=self._col_width * 2,
+                                        yscrollincrement=self._row_height)
+
+        # Every pooled row must be rebound to the (possibly new) deck.
+        # Callers apply the UI first, so an open editor has nothing to keep.
+        self._close_card_editor(commit=False)
+        for row in self._main_rows + self._extra_rows:
+            row["index"] = None
+
+        n_rows = max(len(deck.main_cards), len(deck.extra_cards))
+        self.lists_canvas.configure(scrollregion=(
+            0, 0, self._col_width * 2, self._list_top + n_rows * self._row_height
+        ))
+        self._draw_row_numbers(len(deck.main_cards), len(deck.extra_cards))
+        self._render_visible()
+
+    def _draw_row_numbers(self, main_len, extra_len):
+        """
+        Slot numbers are static text, so draw them straight onto the canvas
+        for every slot rather than giving each row a Label widget.
+        """
+        canvas = self.lists_canvas
+        if self._row_label_ids:
+            canvas.delete(*self._row_label_ids)
+        rh = self._row_height
+        ids = []
+        for x, count in ((0, main_len), (self._col_width, extra_len)):
+            tx = x + self._num_width - 4
+            for i in range(count):
+                ids.append(canvas.create_text(
+                    tx, self._list_top + i * rh + rh // 2, anchor="e", text=f"{i+1:02d}"
+                ))
+        self._row_label_ids = ids
+
+    def _create_card_row(self, section):
+        """Create one pooled row (card label) on the canvas."""
+        frame = tk.Frame(self.lists_canvas)
+        var = tk.StringVar()
+        label = tk.Label(frame, textvariable=var, width=30, anchor="w", relief="groove")
+        label.pack(side=tk.LEFT, padx=2, pady=1)
+
+        row = {
+            "section": section,
+            "frame": frame,
+            "label": label,
+            "var": var,
+            "kid": 0,        # Konami ID shown in this row
+            "index": None,   # deck slot this row currently shows
+            "pos": None,     # (x, y) last given to canvas.coords; None = hidden
+        }
+        row["window"] = self.lists_canvas.create_window(
+            0, 0, window=frame, anchor="nw", state="hidden"
+        )
 
-        while len(deck.extra_cards) < extra_count:
-            if self.app.deck_card_choice_konami:
-                deck.extra_cards.append(self.app.deck_card_choice_konami[0])
-            else:
-                deck.extra_cards.append(0)
-        deck.extra_cards = deck.extra_cards[:extra_count]
+        # Click a slot to edit it with the shared dropdown
+        label.bind("<Button-1>", lambda e, r=row: self._open_card_editor(r))
+        return row
 
-        # Clear frames
-        for child in self.main_cards_frame.winfo_children():
-            child.destroy()
-        for child in self.extra_cards_frame.winfo_children():
-            child.destroy()
+    def _on_lists_wheel(self, event):
+        if not str(event.widget).startswith(str(self.lists_canvas)):
+            return
+        self._wheel_accum += _wheel_steps(event)
+        if self._wheel_after is None:
+            self._wheel_after = self.after(16, self._flush_lists_wheel)
 
-        self.main_card_vars = []
-        self.extra_card_vars = []
-
-        # Build main deck rows
-        for i, kid in enumerate(deck.main_cards):
-            row = i
-            tk.Label(self.main_cards_frame, text=f"{i+1:02d}").grid(row=row, column=0, sticky="e", padx=2, pady=1)
-            var = tk.StringVar()
-            label = self._label_for_konami(kid)
-            var.set(label)
-            cmb = ttk.Combobox(
-                self.main_cards_frame,
-                textvariable=var,
-                values=self.app.deck_card_choices,
-                width=30
-            )
-            cmb.grid(row=row, column=1, sticky="w", padx=2, pady=1)
-            # Filter on typing
-            cmb.bind(
-                "<KeyRelease>",
-                lambda e, cb=cmb, v=var: self._filter_card_combo(e, cb, v)
-            )
-            self.main_card_vars.append(var)
-
-        # Build extra deck rows
-        for i, kid in enumerate(deck.extra_cards):
-            row = i
-            tk.Label(self.extra_cards_frame, text=f"{i+1:02d}").grid(row=row, column=0, sticky="e", padx=2, pady=1)
-            var = tk.StringVar()
-            label = self._label_for_konami(kid)
-            var.set(label)
-            cmb = ttk.Combobox(
-                self.extra_cards_frame,
-                textvariable=var,
-                values=self.app.deck_card_choices,
-                width=30
-            )
-            cmb.grid(row=row, column=1, sticky="w", padx=2, pady=1)
-            cmb.bind(
-                "<KeyRelease>",
-                lambda e, cb=cmb, v=var: self._filter_card_combo(e, cb, v)
-            )
-            self.extra_card_vars.append(var)
+    def _flush_lists_wheel(self):
+        self._wheel_after = None
+        steps, self._wheel_accum = self._wheel_accum, 0
+        if steps:
+            self.lists_canvas.yview_scroll(steps, "units")
+
+    def _on_lists_yview(self, first, last):
+        self._lists_scrollbar.set(first, last)
+        self._schedule_render()
+
+    def _schedule_render(self):
+        """
+        Coalesce re-renders: scrolling and resizing can report several view
+        changes per frame, but the rows only need placing once when idle.
+        """
+        if self._render_after_id is None:
+            self._render_after_id = self.after_idle(self._render_visible)
+
+    def _render_visible(self):
+        """
+        Position pooled rows over the slots inside the visible part of the
+        canvas, growing the pool if the view got taller. If the row being
+        edited leaves its slot, the edit is committed and the editor closed.
+        """
+        if self._render_after_id is not None:
+            self.after_cancel(self._render_after_id)
+            self._render_after_id = None
+        if not self.decks or self._row_height is None:
+            return
+        deck = self.decks[self.current_deck_index]
+        canvas = self.lists_canvas
+        rh = self._row_height
+
+        top = canvas.canvasy(0) - self._list_top
+        bottom = canvas.canvasy(canvas.winfo_height()) - self._list_top
+        first = max(0, int(top // rh))
+        last = max(first, int(bottom // rh) + 1)
+
+        for section, cards, pool, x in (
+            ("main", deck.main_cards, self._main_rows, self._num_width),
+            ("extra", deck.extra_cards, self._extra_rows, self._col_width + self._num_width),
+        ):
+            stop = min(last, len(cards))
+            while len(pool) < stop - first:
+                pool.append(self._create_card_row(section))
+
+            for slot, row in enumerate(pool):
+                i = first + slot
+                if i >= stop:
+                    if row is self._editor_row:
+                        self._close_card_editor()
+                    row["index"] = None
+                    if row["pos"] is not None:
+                        canvas.itemconfigure(row["window"], state="hidden")
+                        row["pos"] = None
+                    continue
+
+                if row["index"] != i:
+                    if row is self._editor_row:
+                        self._close_card_editor()
+                    self._bind_card_row(row, i, cards[i])
+
+                # Only talk to Tk when the row actually moves or reappears
+                pos = (x, self._list_top + i * rh)
+                if row["pos"] != pos:
+                    if row["pos"] is None:
+                        canvas.itemconfigure(row["window"], state="normal")
+                    canvas.coords(row["window"], *pos)
+                    row["pos"] = pos
+
+        if self._editor_row is not None:
+            self._place_card_editor()
+
+    def _bind_card_row(self, row, i, kid):
+        row["index"] = i
+        row["kid"] = kid
+        row["var"].set(self._label_for_konami(kid))
+
+    # ---- shared card editor ----
+
+    def _open_card_editor(self, row):
+        if row is self._editor_row:
+            return
+        self._close_card_editor()
+        if row["index"] is None:
+            return
+
+        self._editor_row = row
+        self._editor_dirty = False
+        cmb = self._editor_combo
+        cmb._bound_kid = row["kid"]
+        # Drop any filter left over from the previous edit; the full list
+        # is restored lazily when the dropdown opens.
+        cmb._filtered = False
+        self._editor_var.set(row["var"].get())
+
+        self._place_card_editor()
+        cmb.focus_set()
+        cmb.select_range(0, tk.END)
+        cmb.icursor(tk.END)
+
+    def _place_card_editor(self):
+        """Lay the shared combobox over the label of the row being edited."""
+        row = self._editor_row
+        if row["pos"] is None:
+            return
+        x, y = row["pos"]
+        self.lists_canvas.coords(
+            self._editor_window, x + row["label"].winfo_x(), y + row["label"].winfo_y()
+        )
+        self.lists_canvas.itemconfigure(self._editor_window, state="normal")
+        # Rows are created after the editor, so raise it above them
+        self._editor_combo.lift()
+
+    def _on_editor_focus_out(self):
+        # Opening the dropdown moves focus to its popdown listbox, which
+        # lives under the combobox's path; that's not the end of the edit.
+        focus = self.tk.call("focus")
+        if focus and str(focus).startswith(str(self._editor_combo)):
+            return
+        self._close_card_editor()
+
+    def _close_card_editor(self, commit=True):
+        row = self._editor_row
+        if row is None:
+            return
+        self._editor_row = None
+        if commit:
+            self._commit_card_editor(row)
+        self.lists_canvas.itemconfigure(self._editor_window, state="hidden")
+
+    def _commit_card_editor(self, row):
+        """
+        Write the editor's Konami ID into the deck slot of row. The ID is
+        kept on the combobox; the text is only parsed if the user typed.
+        """
+        i = row["index"]
+        if i is None or not self.decks:
+            return
+        cmb = self._editor_combo
+        if self._editor_dirty:
+            cmb._bound_kid = self._parse_card_label(self._editor_var.get())
+            self._editor_dirty = False
+        kid = cmb._bound_kid & 0xFFFF
+
+        deck = self.decks[self.current_deck_index]
+        cards = deck.main_cards if row["section"] == "main" else deck.extra_cards
+        if i < len(cards):
+            cards[i] = kid
+            row["kid"] = kid
+            row["var"].set(self._label_for_konami(kid))
+
+    @staticmethod
+    def _parse_card_label(lbl):
+        """'kid: name' (or a bare number) -> Konami ID; 0 if unparsable."""
+        try:
+            kid = int(lbl.partition(":")[0])
+        except ValueError:
+            kid = 0
+        return kid & 0xFFFF
 
     def _label_for_konami(self, kid):
         # Use the prebuilt choices if we know where this Konami ID lives
-        idx = self.app.konami_to_deck_choice_index.get(kid)
-        if idx is not None:
+        idx = self.app.konami_to_choice_arr[kid]
+        if idx >= 0:
             return self.app.deck_card_choices[idx]
         # Fallback: raw ID
         return f"{kid:04d}"
@@ -3904,37 +5148,10 @@ class DeckEditorWindow(tk.Toplevel):
                 except ValueError:
                     pass
 
-        # Counts already normalized in _rebuild_card_lists
-
-        # Main cards
-        new_main = []
-        for var in self.main_card_vars:
-            lbl = var.get()
-            if ":" in lbl:
-                kid_txt = lbl.split(":", 1)[0].strip()
-            else:
-                kid_txt = lbl.strip()
-            try:
-                kid = int(kid_txt)
-            except ValueError:
-                kid = 0
-            new_main.append(kid & 0xFFFF)
-        deck.main_cards = new_main
-
-        # Extra cards
-        new_extra = []
-        for var in self.extra_card_vars:
-            lbl = var.get()
-            if ":" in lbl:
-                kid_txt = lbl.split(":", 1)[0].strip()
-            else:
-                kid_txt = lbl.strip()
-            try:
-                kid = int(kid_txt)
-            except ValueError:
-                kid = 0
-            new_extra.append(kid & 0xFFFF)
-        deck.extra_cards = new_extra
+        # Counts already normalized in _rebuild_card_lists.
+        # Card lists are kept up to date as slots are edited; only the
+        # shared editor can still hold an uncommitted edit.
+        self._close_card_editor()
 
     def _on_save_clicked(self):
         self._apply_ui_to_deck()
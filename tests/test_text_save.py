@@ -0,0 +1,175 @@
+"""
+Saving card text into a ROM copy: shared string slots and free-space
+placement. Run from the repository root with: python -m unittest discover tests
+"""
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import main  # noqa: E402
+from main import CardEntry, RomEditorApp, TEXT_BASE, U32_STRUCT  # noqa: E402
+
+FREE_BASE = TEXT_BASE + 0x200   # start of the zeroed free block
+FREE_SIZE = 0x100
+ROM_SIZE = TEXT_BASE + 0x400
+
+
+def make_app(cards, rom):
+    # The text writers only need these attributes; skip Tk entirely
+    app = RomEditorApp.__new__(RomEditorApp)
+    app.cards = cards
+    app.rom_data = rom
+    app._rom_free_runs = None
+    app._free_runs = None
+    app._text_refs = None
+    app._text_pinned = None
+    return app
+
+
+def make_rom(strings):
+    """
+    ROM whose text block is filled with non-zero filler, then the given
+    strings back to back from TEXT_BASE + 1 and a free block of zeros.
+    Returns (rom, {string: address}).
+    """
+    rom = bytearray(ROM_SIZE)
+    rom[TEXT_BASE:] = b"\xff" * (ROM_SIZE - TEXT_BASE)
+    rom[TEXT_BASE] = 0
+    addrs = {}
+    pos = TEXT_BASE + 1
+    for s in strings:
+        addrs[s] = pos
+        rom[pos:pos + len(s) + 1] = s.encode("ascii") + b"\x00"
+        pos += len(s) + 1
+    assert pos < FREE_BASE
+    rom[FREE_BASE:FREE_BASE + FREE_SIZE] = bytes(FREE_SIZE)
+    return rom, addrs
+
+
+def make_card(rom, index, name, name_addr, desc, desc_addr):
+    name_ptr_off = main.CARD_NAME_PTR_BASE + index * 4
+    desc_ptr_off = main.CARD_DESC_PTR_BASE + index * 4
+    U32_STRUCT.pack_into(rom, name_ptr_off, name_addr - TEXT_BASE)
+    U32_STRUCT.pack_into(rom, desc_ptr_off, desc_addr - TEXT_BASE)
+    return CardEntry(
+        index, name, desc, name_ptr_off, desc_ptr_off,
+        name_addr, desc_addr, len(name), len(desc),
+        0, 0xFFFF, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
+    )
+
+
+def read_text(rom, ptr_off):
+    addr = TEXT_BASE + U32_STRUCT.unpack_from(rom, ptr_off)[0]
+    return rom[addr:rom.index(0, addr)].decode("ascii")
+
+
+def save(app):
+    rom_copy = bytearray(app.rom_data)
+    app._write_card_texts(rom_copy)
+    return rom_copy
+
+
+class SharedTextTest(unittest.TestCase):
+    def setUp(self):
+        self.rom, addrs = make_rom(["Alpha", "Beta", "Shared text"])
+        self.alpha = make_card(self.rom, 0, "Alpha", addrs["Alpha"],
+                               "Shared text", addrs["Shared text"])
+        self.beta = make_card(self.rom, 1, "Beta", addrs["Beta"],
+                              "Shared text", addrs["Shared text"])
+        self.app = make_app([self.alpha, self.beta], self.rom)
+
+    def edit_beta_desc(self, desc):
+        self.app._set_card_desc(self.beta, desc)
+        self.assertTrue(self.beta.text_dirty)
+
+    def assert_texts(self, rom, alpha_desc, beta_desc):
+        self.assertEqual(read_text(rom, self.alpha.name_ptr_off), "Alpha")
+        self.assertEqual(read_text(rom, self.beta.name_ptr_off), "Beta")
+        self.assertEqual(read_text(rom, self.alpha.desc_ptr_off), alpha_desc)
+        self.assertEqual(read_text(rom, self.beta.desc_ptr_off), beta_desc)
+
+    def test_longer_edit_keeps_the_other_cards_text(self):
+        self.edit_beta_desc("A much longer shared description")
+        rom = save(self.app)
+        self.assert_texts(rom, "Shared text", "A much longer shared description")
+
+    def test_shorter_edit_is_not_written_in_place(self):
+        self.edit_beta_desc("Short")
+        rom = save(self.app)
+        self.assert_texts(rom, "Shared text", "Short")
+        self.assertNotEqual(U32_STRUCT.unpack_from(rom, self.beta.desc_ptr_off)[0],
+                            self.alpha.desc_addr - TEXT_BASE)
+
+    def test_both_edited(self):
+        self.edit_beta_desc("Short")
+        self.app._set_card_desc(self.alpha, "Other")
+        rom = save(self.app)
+        self.assert_texts(rom, "Other", "Short")
+
+    def test_unchanged_name_of_edited_card_stays_put(self):
+        self.edit_beta_desc("Short")
+        rom = save(self.app)
+        self.assertEqual(U32_STRUCT.unpack_from(rom, self.beta.name_ptr_off)[0],
+                         self.beta.name_addr - TEXT_BASE)
+
+    def test_saving_twice(self):
+        self.edit_beta_desc("A much longer shared description")
+        first = save(self.app)
+        second = save(self.app)
+        self.assertEqual(first, second)
+
+
+class SuffixTextTest(unittest.TestCase):
+    def test_pointer_into_another_string_keeps_its_tail(self):
+        rom, addrs = make_rom(["Fire Dragon", "Name"])
+        dragon = addrs["Fire Dragon"]
+        a = make_card(rom, 0, "Fire Dragon", dragon, "Name", addrs["Name"])
+        # Card 1's name is the tail of card 0's: "Dragon"
+        b = make_card(rom, 1, "Dragon", dragon + 5, "Name", addrs["Name"])
+        app = make_app([a, b], rom)
+        a.name = "Ice"  # would fit in place over "Fire Dragon"
+        a.text_dirty = True
+        out = save(app)
+        self.assertEqual(read_text(out, a.name_ptr_off), "Ice")
+        self.assertEqual(read_text(out, b.name_ptr_off), "Dragon")
+
+
+class FindFreeSpaceTest(unittest.TestCase):
+    SIZE = 8
+
+    def make_gaps(self):
+        # Gap of exactly SIZE zero bytes, then one of SIZE + 1
+        rom = bytearray(ROM_SIZE)
+        rom[TEXT_BASE:] = b"\xff" * (ROM_SIZE - TEXT_BASE)
+        self.exact = TEXT_BASE + 0x10
+        self.roomy = TEXT_BASE + 0x40
+        rom[self.exact:self.exact + self.SIZE] = bytes(self.SIZE)
+        rom[self.roomy:self.roomy + self.SIZE + 1] = bytes(self.SIZE + 1)
+        return rom
+
+    def check(self, app, rom):
+        addr = app._find_free_space(rom, self.SIZE)
+        # The block goes one past the run's start, so a gap of exactly SIZE
+        # zeros would put the terminator on the byte after it
+        self.assertEqual(addr, self.roomy + 1)
+        self.assertLessEqual(addr + self.SIZE, self.roomy + self.SIZE + 1)
+
+    def test_exact_gap_is_skipped(self):
+        rom = self.make_gaps()
+        self.check(make_app([], rom), rom)
+
+    def test_exact_gap_is_skipped_with_run_index(self):
+        rom = self.make_gaps()
+        app = make_app([], rom)
+        app._free_runs = main._FreeRunIndex(rom, TEXT_BASE, len(rom))
+        self.check(app, rom)
+
+    def test_no_room(self):
+        rom = self.make_gaps()
+        self.assertIsNone(make_app([], rom)._find_free_space(rom, self.SIZE + 1))
+
+
+if __name__ == "__main__":
+    unittest.main()